@@ -0,0 +1,192 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import tempfile
+import time
+import oracle_script
+from mock_turbo_server import MockTurbonomic, start_mock_server, mock_vm_name
+
+# Benchmarks for the create, fetch, update and delete paths, run against the
+# local mock Turbonomic server with synthetic CSV manifests of several sizes.
+# Reports throughput, p50/p99 latency and the number of API requests made.
+#
+#   python benchmark.py --sizes 100,1000 --workers 8 --latency 0.02
+
+SCENARIOS = ("create", "fetch", "update", "delete")
+
+# Write a synthetic manifest with instances_per_server Oracle instances per VM
+def write_manifest(path, rows, instances_per_server=3):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Server_name", "Instance_name", "Port", "Username", "Password", "Authenticate_all"])
+        for i in range(rows):
+            writer.writerow([mock_vm_name(i // instances_per_server), f"db{i}", 1521, "oracle", "secret", "False"])
+    return path
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def summarize(scenario, size, items, elapsed, latencies, requests, failed=0):
+    return {
+        "scenario": scenario,
+        "size": size,
+        "items": items,
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(items / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1) if latencies else None,
+        "requests": requests,
+    }
+
+# Forget every client, cache and index from the previous run
+def reset_client_state():
+    oracle_script.close_clients()
+    oracle_script.clear_resolution_caches()
+    oracle_script._indexes.clear()
+
+def run_create(api, url, manifest, size, workers, prefetch):
+    api.reset_counts()
+    start = time.perf_counter()
+    if prefetch:
+        oracle_script.prefetch_resolution_index(url)
+    results = list(oracle_script.stream_oracle_targets(url, "", oracle_script.iter_csv_rows(manifest), max_workers=workers))
+    elapsed = time.perf_counter() - start
+    latencies = [result["latency"] for result in results if result["latency"] is not None]
+    failed = sum(1 for result in results if result["status"] != "created")
+    return summarize("create", size, len(results), elapsed, latencies, api.total_requests(), failed)
+
+def run_fetch(api, url, size, page_size):
+    api.reset_counts()
+    latencies = []
+    count = 0
+    start = time.perf_counter()
+    page_start = start
+    for page in oracle_script.iter_target_pages(url, "", params={"target_type": "Oracle"}, page_size=page_size):
+        now = time.perf_counter()
+        latencies.append(now - page_start)
+        page_start = now
+        count += len(page)
+    elapsed = time.perf_counter() - start
+    return summarize("fetch", size, count, elapsed, latencies, api.total_requests())
+
+# With rediscover the PUTs and the rediscoveries are timed separately, the
+# latter at rediscover_rate per second (None: unthrottled)
+def run_update(api, url, size, workers, rediscover, rediscover_rate):
+    uuids = list(api.targets)
+    updates = {uuid: {"category": "Applications and Databases", "type": "Oracle", "uuid": uuid,
+                      "inputFields": [{"name": "username", "value": "rotated"}]} for uuid in uuids}
+    finished = {"update": None}
+
+    def on_result(phase, uuid, result):
+        if phase == "update":
+            finished["update"] = time.perf_counter()
+
+    api.reset_counts()
+    start = time.perf_counter()
+    report = oracle_script.bulk_update_targets(url, "", updates, max_workers=workers, rediscover=rediscover,
+                                               rediscover_rate=rediscover_rate, on_result=on_result)
+    elapsed = time.perf_counter() - start
+    latencies = [result["put_latency"] for result in report.values() if result["put_latency"] is not None]
+    failed = sum(1 for result in report.values() if result["status"] != "updated")
+    if not rediscover:
+        return [summarize("update", size, len(report), elapsed, latencies, api.total_requests(), failed)]
+    put_elapsed = (finished["update"] or start) - start
+    rediscover_latencies = [result["rediscover_latency"] for result in report.values() if result.get("rediscover_latency") is not None]
+    rediscovered = sum(1 for result in report.values() if result.get("rediscover") == "ok")
+    return [
+        summarize("update", size, len(report), put_elapsed, latencies, api.request_counts.get("PUT targets", 0), failed),
+        summarize("rediscover", size, rediscovered, elapsed - put_elapsed, rediscover_latencies,
+                  api.request_counts.get("POST targets", 0), len(report) - failed - rediscovered),
+    ]
+
+def run_delete(api, url, size, workers, rate):
+    uuids = list(api.targets)
+    api.reset_counts()
+    start = time.perf_counter()
+    report = oracle_script.bulk_delete_targets(url, "", uuids, max_workers=workers, rate=rate)
+    elapsed = time.perf_counter() - start
+    latencies = [result["latency"] for result in report.values() if result["latency"] is not None]
+    failed = sum(1 for result in report.values() if result["status"] != "deleted")
+    return summarize("delete", size, len(report), elapsed, latencies, api.total_requests(), failed)
+
+# Run the chosen scenarios, in order, for one manifest size against a fresh mock server
+def run_size(size, args, workdir):
+    api = MockTurbonomic(vms=max(size // args.instances_per_server + 1, args.vms), latency=args.latency,
+                         jitter=args.jitter, retry_after=args.retry_after, seed=size)
+    server, url = start_mock_server(api)
+    reset_client_state()
+    results = []
+    try:
+        if not oracle_script.login(url, "administrator", "administrator"):
+            raise RuntimeError("Could not log in to the mock server.")
+        # Inject errors only once logged in; the scenarios are what is being measured
+        api.error_rate = args.error_rate
+        manifest = write_manifest(os.path.join(workdir, f"manifest-{size}.csv"), size, args.instances_per_server)
+        if "create" in args.scenarios:
+            results.append(run_create(api, url, manifest, size, args.workers, args.prefetch))
+        if "fetch" in args.scenarios:
+            results.append(run_fetch(api, url, size, args.page_size))
+        if "update" in args.scenarios:
+            results.extend(run_update(api, url, size, args.workers, args.rediscover, args.rediscover_rate))
+        if "delete" in args.scenarios:
+            results.append(run_delete(api, url, size, args.workers, args.rate))
+        connections = oracle_script.get_client(url).connection_stats()
+        for result in results:
+            result["connection_reuse_ratio"] = connections["reuse_ratio"]
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+def print_table(results):
+    columns = ("scenario", "size", "items", "failed", "seconds", "items_per_second", "p50_ms", "p99_ms", "requests")
+    print(" ".join(f"{column:>16}" for column in columns))
+    for result in results:
+        print(" ".join(f"{str(result[column]):>16}" for column in columns))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark oracle_script against a local mock Turbonomic API")
+    parser.add_argument("--sizes", default="100,1000", help="Comma separated manifest sizes (rows)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--workers", type=int, default=oracle_script.MAX_WORKERS, help="Requests in flight for bulk operations")
+    parser.add_argument("--rate", type=float, default=None, help="Requests per second ceiling for deletes")
+    parser.add_argument("--page-size", type=int, default=oracle_script.PAGE_SIZE)
+    parser.add_argument("--instances-per-server", type=int, default=3)
+    parser.add_argument("--vms", type=int, default=0, help="Minimum number of VMs in the mock inventory")
+    parser.add_argument("--prefetch", action="store_true", help="Prefetch the VM/group index before creating")
+    parser.add_argument("--rediscover", action="store_true", help="Rediscover targets after the bulk update (reported as its own row)")
+    parser.add_argument("--rediscover-rate", type=float, default=None,
+                        help=f"Rediscoveries started per second (default: no limit; the tool itself uses {oracle_script.REDISCOVER_RATE})")
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds of latency added by the mock server")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests the mock answers with 503")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds sent with injected 503s")
+    parser.add_argument("--verbose", action="store_true", help="Show oracle_script's log output")
+    parser.add_argument("--request-log", default=None, help="Write one JSON line per HTTP request to this (rotating) file")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+    args.scenarios = [scenario.strip() for scenario in args.scenarios.split(",") if scenario.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    oracle_script.setup_logging(logging.INFO if args.verbose else logging.CRITICAL, request_log=args.request_log)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            results.extend(run_size(size, args, workdir))
+    print_table(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
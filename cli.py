@@ -0,0 +1,439 @@
+import argparse
+import copy
+import csv
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import oracle_script
+from oracle_script import (
+    MAX_WORKERS, PAGE_SIZE, REDISCOVER_RATE, login, iter_csv_rows, stream_oracle_targets,
+    prefetch_resolution_index, iter_target_pages, bulk_update_targets, bulk_delete_targets,
+    delete_oracle_targets, plan_reconcile, execute_reconcile, reconcile_summary, oracle_target_id, metrics,
+    JobJournal, VALIDATION_TIMEOUT, track_validation, created_keys, validation_summary,
+)
+from inventory_store import INVENTORY_FIELDS, inventory_row
+
+# Headless batch runner for cron jobs and containers. Never imports tkinter.
+# Writes one JSON object per line to stdout as each target is processed and a
+# final {"event": "summary", ...} line; logs go to stderr.
+#
+#   export TURBO_URL=https://turbo.example.com TURBO_USERNAME=administrator TURBO_PASSWORD=...
+#   python cli.py create --input targets.csv --workers 8
+#   python cli.py fetch --output targets.jsonl
+#   python cli.py update --input changes.csv --rate 2
+#   python cli.py delete --critical --rate 5
+#   python cli.py sync --input targets.csv --dry-run
+#   python cli.py create --input targets.csv --journal run.jsonl   # rerun the same line to resume
+#   python cli.py create --instances instances.json --input targets.csv --route-column Instance
+#
+# Exit status: 0 when everything succeeded, 1 when some targets failed, 2 when
+# the run could not start (bad arguments, login failed).
+
+# Columns read from the update CSV; blank cells are left unchanged on the target
+UPDATE_FIELDS = ("username", "password", "port", "databaseID", "fullValidation")
+
+_emit_lock = threading.Lock()
+# Instance name of the fan-out run on this thread, added to every progress record
+_context = threading.local()
+
+# Write one progress record to stdout
+def emit(event, **fields):
+    instance = getattr(_context, "instance", None)
+    line = json.dumps({"event": event, **({"instance": instance} if instance else {}), **fields}, default=str)
+    with _emit_lock:
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+def write_output(path, data):
+    if path:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2, default=str)
+
+def count_status(results, status):
+    return sum(1 for result in results if result["status"] == status)
+
+def run_create(args, token):
+    if args.prefetch:
+        prefetch_resolution_index(args.url, token)
+    results = []
+    for result in stream_oracle_targets(args.url, token, iter_csv_rows(args.input), max_workers=args.workers, journal=args.journal):
+        results.append(result)
+        emit("create", **result)
+    created = count_status(results, "created")
+    summary = {"created": created, "failed": len(results) - created}
+    if args.validate:
+        add_validation(args, token, results, summary)
+    return summary, results
+
+# Wait for the targets created in results to validate, streaming one
+# "validation" line per target, and fold the outcome into summary. Targets
+# that fail validation or time out count as failed.
+def add_validation(args, token, results, summary):
+    def on_result(key, result):
+        emit("validation", key=key, **result)
+
+    validation = track_validation(args.url, token, created_keys(results), timeout=args.validation_timeout,
+                                  on_result=on_result) or {}
+    for result in results:
+        key = result["uuid"] or result["targetId"]
+        if key in validation:
+            result["validation"] = validation[key]["status"]
+    counts = validation_summary(validation)
+    summary["validation"] = counts
+    summary["failed"] += counts["failed"] + counts["timed_out"]
+
+def run_fetch(args, token):
+    params = {"target_type": args.target_type}
+    if args.critical:
+        params["health_state"] = "CRITICAL"
+    count = 0
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    try:
+        for page in iter_target_pages(args.url, token, params=params, page_size=args.page_size):
+            for target in page:
+                count += 1
+                emit("target", **dict(zip(INVENTORY_FIELDS, inventory_row(target))))
+                if output:
+                    output.write(json.dumps(target) + "\n")
+    finally:
+        if output:
+            output.close()
+    return {"fetched": count}, None
+
+# Read {uuid: update payload} from a CSV with a uuid column and any of UPDATE_FIELDS
+def read_updates(path):
+    updates = {}
+    with open(path, mode="r", encoding="utf-8-sig", newline="") as file:
+        for row in csv.DictReader(file):
+            uuid = (row.get("uuid") or "").strip()
+            if not uuid:
+                continue
+            updates[uuid] = {
+                "category": "Applications and Databases",
+                "type": "Oracle",
+                "uuid": uuid,
+                "inputFields": [{"name": name, "value": row[name].strip()} for name in UPDATE_FIELDS if (row.get(name) or "").strip()],
+            }
+    return updates
+
+def run_update(args, token):
+    updates = read_updates(args.input)
+
+    def on_result(phase, uuid, result):
+        emit(phase, uuid=uuid, **result)
+
+    report = bulk_update_targets(args.url, token, updates, max_workers=args.workers, rediscover=args.rediscover,
+                                 rediscover_rate=args.rate or REDISCOVER_RATE, on_result=on_result, journal=args.journal) or {}
+    updated = count_status(report.values(), "updated")
+    rediscover_failed = sum(1 for result in report.values() if result["rediscover"] == "failed")
+    return {"updated": updated, "failed": len(report) - updated + rediscover_failed}, report
+
+# UUIDs from a text file (one per line) or a CSV whose first column is the UUID
+def read_uuids(path):
+    with open(path, mode="r", encoding="utf-8-sig", newline="") as file:
+        for row in csv.reader(file):
+            if row and row[0].strip() and row[0].strip().lower() != "uuid":
+                yield row[0].strip()
+
+def run_delete(args, token):
+    def on_result(uuid, result):
+        emit("delete", uuid=uuid, **result)
+
+    if args.critical:
+        report = delete_oracle_targets(args.url, token, page_size=args.page_size, max_workers=args.workers, rate=args.rate,
+                                       on_result=on_result, journal=args.journal)
+    else:
+        report = bulk_delete_targets(args.url, token, read_uuids(args.input), max_workers=args.workers, rate=args.rate,
+                                     on_result=on_result, journal=args.journal)
+    report = report or {}
+    deleted = count_status(report.values(), "deleted")
+    return {"deleted": deleted, "failed": len(report) - deleted}, report
+
+def run_sync(args, token):
+    plan = plan_reconcile(args.url, token, iter_csv_rows(args.input), delete_extra=args.delete_extra)
+    # Rows to create still hold passwords; only their targetIds are reported
+    for row in plan["create"]:
+        emit("plan", action="create", targetId=oracle_target_id(row[0], row[1]))
+    for update in plan["update"]:
+        emit("plan", action="update", uuid=update["uuid"], targetId=update["targetId"], changed=update["changed"])
+    for delete in plan["delete"]:
+        emit("plan", action="delete", **delete)
+    if args.dry_run:
+        summary = {"create": len(plan["create"]), "update": len(plan["update"]),
+                   "delete": len(plan["delete"]), "unchanged": len(plan["unchanged"])}
+        return summary, {**summary, "update_targets": plan["update"], "delete_targets": plan["delete"]}
+
+    if args.prefetch and plan["create"]:
+        prefetch_resolution_index(args.url, token)
+
+    def on_result(action, key, result):
+        emit(action, **({"targetId": key} if action == "create" else {"uuid": key}), **{k: v for k, v in result.items() if k != "targetId"})
+
+    report = execute_reconcile(args.url, token, plan, max_workers=args.workers, rediscover=args.rediscover, rate=args.rate,
+                               on_result=on_result, journal=args.journal)
+    summary = reconcile_summary(report)
+    summary["failed"] = summary["create_failed"] + summary["update_failed"] + summary["delete_failed"]
+    if args.validate and report["created"]:
+        add_validation(args, token, report["created"], summary)
+    return summary, report
+
+# Multi-instance fan-out. The instances file is JSON:
+#   {"instances": [
+#       {"name": "emea", "url": "https://turbo-emea.example.com", "username": "administrator",
+#        "password_env": "TURBO_PASSWORD_EMEA", "workers": 8, "rate": 5},
+#       {"name": "apac", "url": "https://turbo-apac.example.com", "username": "administrator",
+#        "password_env": "TURBO_PASSWORD_APAC", "input": "apac.csv", "workers": 4}]}
+# "password" may be given instead of "password_env" (not recommended). Each
+# instance reads its own "input" if it has one, otherwise its slice of --input
+# picked by --route-column, otherwise the whole of --input. workers/rate
+# override --workers/--rate for that instance only.
+def load_instances(path):
+    with open(path, "r", encoding="utf-8") as file:
+        config = json.load(file)
+    instances = config["instances"] if isinstance(config, dict) else config
+    names = set()
+    for instance in instances:
+        if not instance.get("url") or not instance.get("username"):
+            raise ValueError(f"Instance {instance.get('name') or instance.get('url')} needs a url and a username.")
+        instance.setdefault("name", instance["url"])
+        if instance["name"] in names:
+            raise ValueError(f"Instance name {instance['name']} is used more than once.")
+        names.add(instance["name"])
+        if "password" not in instance:
+            env = instance.get("password_env")
+            if not env or env not in os.environ:
+                raise ValueError(f"Instance {instance['name']} has no password; set {env or 'password_env'}.")
+            instance["password"] = os.environ[env]
+    return instances
+
+# Split a manifest into one CSV per instance by the value of its routing column.
+# The routing column is dropped so the slices have the normal column layout.
+# Returns ({instance name: slice path}, rows with an unknown instance).
+def split_manifest(path, route_column, names, workdir):
+    with open(path, mode="r", encoding="utf-8-sig", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        lowered = [column.strip().lower() for column in header]
+        if route_column.strip().lower() not in lowered:
+            raise ValueError(f"{path} has no {route_column} column.")
+        index = lowered.index(route_column.strip().lower())
+        paths = {name: os.path.join(workdir, f"slice-{i}.csv") for i, name in enumerate(names)}
+        files = {name: open(slice_path, "w", encoding="utf-8", newline="") for name, slice_path in paths.items()}
+        unrouted = 0
+        try:
+            writers = {name: csv.writer(slice_file) for name, slice_file in files.items()}
+            for writer in writers.values():
+                writer.writerow(header[:index] + header[index + 1:])
+            for row in reader:
+                if not row:
+                    continue
+                name = row[index].strip() if len(row) > index else ""
+                if name not in writers:
+                    unrouted += 1
+                    sliced = row[:index] + row[index + 1:]
+                    emit("skipped", targetId=oracle_target_id(*sliced[:2]) if len(sliced) > 1 else None,
+                         error=f"No instance named {name!r}.")
+                    continue
+                writers[name].writerow(row[:index] + row[index + 1:])
+        finally:
+            for slice_file in files.values():
+                slice_file.close()
+    return paths, unrouted
+
+# Output path for one instance when a command writes its own file (fetch)
+def instance_output(path, name):
+    if not path:
+        return None
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{''.join(c if c.isalnum() or c in '-_' else '_' for c in name)}{extension}"
+
+# Log in to one instance and run the command against it on this thread
+def run_instance(args, instance, slices):
+    _context.instance = instance["name"]
+    instance_args = copy.copy(args)
+    instance_args.url = instance["url"].rstrip("/")
+    instance_args.username = instance["username"]
+    instance_args.password = instance["password"]
+    instance_args.workers = int(instance.get("workers") or args.workers)
+    instance_args.rate = instance.get("rate", args.rate)
+    if hasattr(args, "input"):
+        instance_args.input = instance.get("input") or slices.get(instance["name"]) or args.input
+    if args.command == "fetch":
+        instance_args.output = instance_output(args.output, instance["name"])
+    instance_args.journal_path = instance_output(args.journal_path, instance["name"])
+    # Each instance gets its own connection pool and concurrency ceiling
+    oracle_script.configure_client(instance_args.url, initial_concurrency=instance_args.workers,
+                                   max_concurrency=instance_args.workers)
+    start = time.perf_counter()
+    try:
+        token = login(instance_args.url, instance_args.username, instance_args.password)
+        if not token:
+            summary, report = {"failed": 1, "error": "Login failed. Check the URL and credentials."}, None
+        else:
+            summary, report = run_command(instance_args, token)
+    except Exception as e:
+        summary, report = {"failed": 1, "error": str(e)}, None
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    emit("instance_summary", command=args.command, **summary)
+    _context.instance = None
+    return instance["name"], summary, report
+
+# Run the command against every instance at once. Returns the merged summary
+# (per instance and totals) and {instance name: report}.
+def run_fleet(args):
+    instances = load_instances(args.instances)
+    with tempfile.TemporaryDirectory() as workdir:
+        slices, unrouted = {}, 0
+        if args.route_column and getattr(args, "input", None):
+            slices, unrouted = split_manifest(args.input, args.route_column, [instance["name"] for instance in instances], workdir)
+        parallel = args.parallel or len(instances)
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            outcomes = list(executor.map(lambda instance: run_instance(args, instance, slices), instances))
+
+    totals = {}
+    for _, summary, _ in outcomes:
+        for key, value in summary.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and key != "seconds":
+                totals[key] = totals.get(key, 0) + value
+    totals["failed"] = totals.get("failed", 0) + unrouted
+    if unrouted:
+        totals["unrouted"] = unrouted
+    summary = {**totals, "instances": {name: instance_summary for name, instance_summary, _ in outcomes}}
+    # fetch has already written each instance's targets to its own --output file
+    if args.command == "fetch":
+        return summary, None
+    return summary, {name: report for name, _, report in outcomes}
+
+# Run one command, with its journal open when --journal was given
+def run_command(args, token):
+    args.journal = None
+    if args.journal_path and args.command != "fetch" and not getattr(args, "dry_run", False):
+        args.journal = JobJournal(args.journal_path, args.url)
+        if args.journal.resumed:
+            emit("resume", journal=args.journal_path, **args.journal.stats())
+    try:
+        summary, report = COMMANDS[args.command](args, token)
+    finally:
+        if args.journal:
+            args.journal.close()
+    if args.journal:
+        summary["resumed"] = args.journal.skipped
+    return summary, report
+
+COMMANDS = {
+    "create": run_create,
+    "fetch": run_fetch,
+    "update": run_update,
+    "delete": run_delete,
+    "sync": run_sync,
+}
+
+def parse_args(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--url", default=os.environ.get("TURBO_URL"), help="Turbonomic URL including https:// (or TURBO_URL)")
+    common.add_argument("--username", default=os.environ.get("TURBO_USERNAME"), help="Turbonomic username (or TURBO_USERNAME)")
+    common.add_argument("--password", default=os.environ.get("TURBO_PASSWORD"), help="Turbonomic password; prefer TURBO_PASSWORD so it stays out of the process list")
+    common.add_argument("--workers", type=int, default=MAX_WORKERS, help="Requests in flight at once")
+    common.add_argument("--rate", type=float, default=None, help="Deletes/rediscoveries started per second (default: no limit for deletes)")
+    common.add_argument("--output", default=None, help="Write the final report (fetch: the targets, one JSON per line) to this file")
+    common.add_argument("--journal", dest="journal_path", default=None,
+                        help="Record progress in this journal file; running again with the same journal resumes an interrupted run")
+    common.add_argument("--metrics-json", default=None, help="Write request metrics to this JSON file")
+    common.add_argument("--metrics-prometheus", default=None, help="Write request metrics in Prometheus text format to this file")
+    common.add_argument("--verbose", action="store_true", help="Log progress to stderr")
+    common.add_argument("--log-file", default=None, help="Also write the log to this file (rotated at 10 MB)")
+    common.add_argument("--request-log", default=None, help="Write one JSON line per HTTP request to this file (rotated at 10 MB)")
+    common.add_argument("--instances", default=None, help="JSON file listing Turbonomic instances to run against at once")
+    common.add_argument("--route-column", default=None, help="With --instances: CSV column naming the instance for each row")
+    common.add_argument("--parallel", type=int, default=None, help="With --instances: instances run at once (default: all)")
+
+    parser = argparse.ArgumentParser(description="Batch runner for Turbonomic Oracle targets")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", parents=[common], help="Create targets from a CSV")
+    create.add_argument("--input", help="Target CSV (Server_name, Instance_name, Port, Username, Password, Authenticate_all)")
+    create.add_argument("--prefetch", action="store_true", help="Load every VM and Oracle group up front")
+    create.add_argument("--validate", action="store_true", help="Wait for the new targets to validate")
+    create.add_argument("--validation-timeout", type=float, default=VALIDATION_TIMEOUT, help="Seconds to wait with --validate")
+
+    fetch = commands.add_parser("fetch", parents=[common], help="List targets")
+    fetch.add_argument("--target-type", default="Oracle")
+    fetch.add_argument("--critical", action="store_true", help="Only targets in a CRITICAL health state")
+    fetch.add_argument("--page-size", type=int, default=PAGE_SIZE)
+
+    update = commands.add_parser("update", parents=[common], help="Update targets from a CSV")
+    update.add_argument("--input", help=f"CSV with a uuid column and any of: {', '.join(UPDATE_FIELDS)}")
+    update.add_argument("--no-rediscover", dest="rediscover", action="store_false", help="Don't rediscover updated targets")
+
+    delete = commands.add_parser("delete", parents=[common], help="Delete targets")
+    which = delete.add_mutually_exclusive_group()
+    which.add_argument("--input", help="File with one target UUID per line (or a CSV with the UUID first)")
+    which.add_argument("--critical", action="store_true", help="Delete every CRITICAL Oracle target")
+    delete.add_argument("--page-size", type=int, default=PAGE_SIZE)
+
+    sync = commands.add_parser("sync", parents=[common], help="Reconcile live targets with a CSV")
+    sync.add_argument("--input", help="Target CSV, as for create")
+    sync.add_argument("--dry-run", action="store_true", help="Only report the plan")
+    sync.add_argument("--delete-extra", action="store_true", help="Delete Oracle targets that are not in the CSV")
+    sync.add_argument("--prefetch", action="store_true", help="Load every VM and Oracle group up front")
+    sync.add_argument("--validate", action="store_true", help="Wait for the new targets to validate")
+    sync.add_argument("--validation-timeout", type=float, default=VALIDATION_TIMEOUT, help="Seconds to wait with --validate")
+    sync.add_argument("--no-rediscover", dest="rediscover", action="store_false", help="Don't rediscover updated targets")
+
+    args = parser.parse_args(argv)
+    # With --instances the credentials (and optionally the inputs) come from the instances file
+    if not args.instances:
+        missing = [name for name in ("url", "username", "password") if not getattr(args, name)]
+        if missing:
+            parser.error(f"Missing {', '.join('--' + name for name in missing)} (or the matching TURBO_* environment variable)")
+        if args.command in ("create", "update", "sync") and not args.input:
+            parser.error("--input is required")
+        if args.command == "delete" and not (args.input or args.critical):
+            parser.error("one of --input or --critical is required")
+        if args.route_column:
+            parser.error("--route-column needs --instances")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    oracle_script.setup_logging(logging.INFO if args.verbose else logging.WARNING, log_file=args.log_file, request_log=args.request_log)
+    oracle_script.configure_clients(initial_concurrency=args.workers)
+
+    start = time.perf_counter()
+    try:
+        if args.instances:
+            try:
+                summary, report = run_fleet(args)
+            except (OSError, ValueError, KeyError) as e:
+                emit("error", command=args.command, error=f"Could not start the fan-out run: {e}")
+                return 2
+        else:
+            token = login(args.url, args.username, args.password)
+            if not token:
+                emit("error", command=args.command, error="Login failed. Check the URL and credentials.")
+                return 2
+            try:
+                summary, report = run_command(args, token)
+            except (OSError, ValueError) as e:
+                emit("error", command=args.command, error=str(e))
+                return 2
+        if report is not None:
+            write_output(args.output, report)
+    finally:
+        if args.metrics_json:
+            metrics.dump_json(args.metrics_json)
+        if args.metrics_prometheus:
+            metrics.dump_prometheus(args.metrics_prometheus)
+        oracle_script.close_clients()
+    emit("summary", command=args.command, seconds=round(time.perf_counter() - start, 3), **summary)
+    return 1 if summary.get("failed") else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
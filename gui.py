@@ -1,15 +1,259 @@
 import tkinter as tk
 import argparse as args
+import bisect
+import hashlib
+import logging
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
 from tkinter import ttk, filedialog, messagebox
-from oracle_script import oracle_csv_to_json
+from inventory_store import InventoryStore, refresh_inventory
+from oracle_script import iter_csv_rows
+from oracle_script import stream_oracle_targets
 from oracle_script import login 
-from oracle_script import create_oracle_targets
-from oracle_script import get_targets
-from oracle_script import update_target
+from oracle_script import bulk_update_targets
 from oracle_script import delete_oracle_targets
-from oracle_script import delete_target
+from oracle_script import bulk_delete_targets
+from oracle_script import metrics
+from oracle_script import Target, TargetInventory
+from oracle_script import JobJournal
+from oracle_script import track_validation, created_keys
+from oracle_script import setup_logging, LOGGER_NAME
 # from oracle_script import delete_scope
 
+logger = logging.getLogger(LOGGER_NAME + ".gui")
+
+# Rows inserted or updated per event loop turn when filling the table
+TREEVIEW_CHUNK_SIZE = 500
+
+TARGET_COLUMNS = ("uuid", "displayName", "username", "port", "databaseId", "status", "lastEditTime", "scope")
+
+# Target attribute shown in each table column
+COLUMN_ATTRIBUTES = {
+    "uuid": "uuid",
+    "displayName": "display_name",
+    "username": "username",
+    "port": "port",
+    "databaseId": "database_id",
+    "status": "status",
+    "lastEditTime": "last_edit_time",
+    "scope": "scope",
+}
+
+# Columns the filter box searches, and the names accepted before a ":" to
+# search just one of them by prefix (e.g. "status:valid", "port:15")
+FILTER_COLUMNS = ("displayName", "username", "port", "databaseId", "status", "scope")
+FILTER_ALIASES = {
+    "name": "displayName", "displayname": "displayName",
+    "user": "username", "username": "username",
+    "port": "port",
+    "db": "databaseId", "databaseid": "databaseId",
+    "status": "status",
+    "scope": "scope",
+}
+
+# Milliseconds to wait after the last keystroke before filtering
+FILTER_DELAY_MS = 150
+
+# Sort key for a column value: numbers (ports) in numeric order, then text ignoring case
+def sort_key(value):
+    text = "" if value is None else str(value)
+    return (0, int(text), "") if text.isdigit() else (1, 0, text.lower())
+
+# In-memory search and sort index over the targets in the table. Each row's
+# filter columns are kept lower-cased (and joined into one string for plain
+# substring searches); per-column sort orders and prefix lists are built the
+# first time they're needed and reused until a row changes. Filtering or
+# re-sorting then only produces a list of UUIDs in display order, which the
+# table applies in a single call instead of being rebuilt.
+class TargetIndex:
+    def __init__(self):
+        self.values = {}  # uuid -> {column: lower-cased value}, in insertion order
+        self.text = {}  # uuid -> filter columns joined, for substring search
+        self._orders = {}  # column -> uuids in ascending order
+        self._prefixes = {}  # column -> ([lower-cased values, sorted], [uuids])
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, target):
+        values = {column: str(getattr(target, attribute) or "").lower() for column, attribute in COLUMN_ATTRIBUTES.items()}
+        if self.values.get(target.uuid) == values:
+            return
+        self.values[target.uuid] = values
+        self.text[target.uuid] = "\x00".join(values[column] for column in FILTER_COLUMNS)
+        self._orders.clear()
+        self._prefixes.clear()
+
+    def remove(self, uuid):
+        if self.values.pop(uuid, None) is not None:
+            del self.text[uuid]
+            self._orders.clear()
+            self._prefixes.clear()
+
+    def clear(self):
+        self.values.clear()
+        self.text.clear()
+        self._orders.clear()
+        self._prefixes.clear()
+
+    def order(self, column):
+        if column not in self._orders:
+            self._orders[column] = sorted(self.values, key=lambda uuid: sort_key(self.values[uuid][column]))
+        return self._orders[column]
+
+    # UUIDs whose value in column starts with prefix, found by bisecting the sorted values
+    def prefix_matches(self, column, prefix):
+        if column not in self._prefixes:
+            pairs = sorted((values[column], uuid) for uuid, values in self.values.items())
+            self._prefixes[column] = ([value for value, _ in pairs], [uuid for _, uuid in pairs])
+        values, uuids = self._prefixes[column]
+        start = bisect.bisect_left(values, prefix)
+        end = bisect.bisect_right(values, prefix + "\uffff", start)
+        return set(uuids[start:end])
+
+    # UUIDs matching every term of query, or None if the query is empty. A
+    # "column:text" term matches values starting with text in that column;
+    # any other term matches text anywhere in the filter columns.
+    def match(self, query):
+        matches = None
+        for term in query.lower().split():
+            name, _, prefix = term.partition(":")
+            if prefix and name in FILTER_ALIASES:
+                found = self.prefix_matches(FILTER_ALIASES[name], prefix)
+            else:
+                source = self.text if matches is None else {uuid: self.text[uuid] for uuid in matches}
+                found = {uuid for uuid, text in source.items() if term in text}
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        return matches
+
+    # UUIDs to show, in display order, for a filter and sort column
+    def view(self, query="", sort_column=None, descending=False):
+        ordered = self.order(sort_column) if sort_column else list(self.values)
+        if descending:
+            ordered = ordered[::-1]
+        matches = self.match(query)
+        return ordered if matches is None else [uuid for uuid in ordered if uuid in matches]
+
+# Turn a stored inventory row into the tuple of values shown in the table
+def display_row(row):
+    return tuple(str(value) for value in row)
+
+# Open the on-disk target inventory, falling back to an in-memory one if it can't be used
+def open_inventory():
+    try:
+        return InventoryStore()
+    except (OSError, sqlite3.Error) as e:
+        messagebox.showwarning("Inventory", f"Could not open the local target cache, targets won't be remembered between sessions: {e}")
+        return InventoryStore(":memory:")
+
+# Create runs keep a journal here, one per server and CSV file, so an
+# interrupted run can be resumed instead of started over
+JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".turbo_script_tool", "journals")
+
+def journal_path(api_url, filepath):
+    key = hashlib.sha1(f"{api_url}\n{os.path.abspath(filepath)}".encode()).hexdigest()[:16]
+    return os.path.join(JOURNAL_DIR, f"create-{key}.jsonl")
+
+# Number of entries in a bulk operation report with the given status
+def count_status(report, status):
+    return sum(1 for result in (report or {}).values() if result["status"] == status)
+
+# Handle given to a background job so it can talk to the UI safely
+class Job:
+    def __init__(self, runner):
+        self._runner = runner
+        self.cancel_event = runner.cancel_event
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    # Run fn(*args) on the Tk main thread
+    def call(self, fn, *args):
+        self._runner.events.put((fn, args))
+
+    def progress(self, done, total=None, message=""):
+        self.call(self._runner.on_progress, done, total, message)
+
+# Runs one network job at a time off the Tk main thread. Workers never touch
+# widgets directly: everything they send back is queued and replayed from the
+# Tk event loop by _poll.
+class JobRunner:
+    def __init__(self, root, on_progress, on_busy, poll_ms=50):
+        self.root = root
+        self.on_progress = on_progress
+        self.on_busy = on_busy
+        self.poll_ms = poll_ms
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.busy = False
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.root.after(self.poll_ms, self._poll)
+
+    # work(job) runs on the worker thread; on_done(result) / on_error(exception)
+    # run on the main thread once it finishes
+    def submit(self, work, on_done=None, on_error=None):
+        if self.busy:
+            messagebox.showinfo("Busy", "Another operation is still running. Wait for it to finish or cancel it.")
+            return False
+        self.busy = True
+        self.cancel_event.clear()
+        self.on_busy(True)
+        job = Job(self)
+
+        def run():
+            try:
+                result = work(job)
+            except Exception as e:
+                job.call(self._finish, on_error or self._show_error, e)
+            else:
+                job.call(self._finish, on_done, result)
+
+        self._executor.submit(run)
+        return True
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def shutdown(self):
+        self.cancel_event.set()
+        self._executor.shutdown(wait=False)
+
+    def _finish(self, callback, value):
+        self.busy = False
+        self.on_busy(False)
+        if callback:
+            callback(value)
+
+    def _show_error(self, error):
+        messagebox.showerror("Error", str(error))
+
+    # A callback that raises is reported and skipped; polling always goes on,
+    # otherwise the job could never finish and the buttons would stay disabled
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    fn, args = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    fn(*args)
+                except Exception as e:
+                    logger.exception("Error in %s", getattr(fn, "__name__", fn))
+                    try:
+                        self._show_error(e)
+                    except Exception:
+                        pass
+        finally:
+            self.root.after(self.poll_ms, self._poll)
+
 class TargetManagerApp:
     def __init__(self, root, ip_address, username, password):
         self.root = root
@@ -17,8 +261,16 @@ class TargetManagerApp:
         # Store filepath to the CSV file to create targets
         self.filepath = tk.StringVar(value="No file selected")
 
-        # Store of all targets
-        self.env_targets = []
+        # Store of all targets shown in the table, indexed by UUID (also the Treeview iid) and targetId
+        self.env_targets = TargetInventory()
+        # Search and sort index over the same targets, and the current view of the table
+        self.target_index = TargetIndex()
+        self.filter_var = tk.StringVar()
+        self.sort_column = None
+        self.sort_descending = False
+        self.filter_after_id = None
+        self.view_stale = False
+        self.view_count_var = tk.StringVar()
         
         # Credentials
         self.token = tk.StringVar()
@@ -34,10 +286,30 @@ class TargetManagerApp:
         self.port_var = tk.StringVar()
         self.db_ID_var = tk.StringVar()
         self.full_validation_var = tk.BooleanVar()
+        self.rediscover_var = tk.BooleanVar(value=True)
+        self.validate_var = tk.BooleanVar(value=True)
         
+        # Progress of the running background job
+        self.status_var = tk.StringVar(value="Idle")
+
+        # Rows and removals of a refresh still waiting to be applied to the table
+        self.pending_rows = deque()
+        self.applying_rows = False
+
+        # Local copy of the target list, shown immediately and refreshed incrementally
+        self.inventory = open_inventory()
+        self.shown_api_url = None
+
         # Create all the widgets inside the scrollable frame
         self.create_widgets()
 
+        # All network work runs off the main thread so the window stays responsive
+        self.jobs = JobRunner(self.root, on_progress=self.show_progress, on_busy=self.set_busy)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Draw whatever we know from the last session straight away
+        self.show_cached_targets(self.ipAddress_var.get())
+
     def create_widgets(self):
         # Section 1: Credentials (IP Address, Username, Password)
         self.credentials_frame = ttk.LabelFrame(self.root, text="Credentials", padding="10")
@@ -66,6 +338,10 @@ class TargetManagerApp:
         self.create_targets_button = ttk.Button(self.upload_frame, text="Create targets", command=self.create_targets)
         self.create_targets_button.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
 
+        # Wait for the new targets to validate before reporting the result
+        self.validate_checkbox = ttk.Checkbutton(self.upload_frame, text="Wait for validation", variable=self.validate_var)
+        self.validate_checkbox.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+
         # Label to display the file path after selecting a file
         self.filepath_label = ttk.Label(self.upload_frame, textvariable=self.filepath, wraplength=300, anchor="w")
         self.filepath_label.grid(row=0, column=1, padx=5, pady=5, sticky="w")
@@ -94,6 +370,10 @@ class TargetManagerApp:
         self.full_validation_checkbox = ttk.Checkbutton(self.form_frame, text="Full Validation", variable=self.full_validation_var)
         self.full_validation_checkbox.grid(row=5, column=0, columnspan=2, padx=5, pady=5, sticky="w")
 
+        # Rediscover Checkbox
+        self.rediscover_checkbox = ttk.Checkbutton(self.form_frame, text="Rediscover after change", variable=self.rediscover_var)
+        self.rediscover_checkbox.grid(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+
         self.change_button = ttk.Button(self.form_frame, text="Change Selected Targets", command=self.show_selected_json)
         self.change_button.grid(row=7, column=0, padx=5, pady=5, sticky="ew")
 
@@ -101,18 +381,22 @@ class TargetManagerApp:
         self.delete_selection_button.grid(row=8, column=0, padx=5, pady=5, sticky="ew")
 
         # Treeview to show targets
-        self.target_treeview = ttk.Treeview(self.form_frame, columns=("uuid", "displayName", "username", "port", "databaseId", "status", "lastEditTime", "scope"), show="headings", selectmode="extended")
+        self.target_treeview = ttk.Treeview(self.form_frame, columns=TARGET_COLUMNS, show="headings", selectmode="extended")
         self.target_treeview.grid(row=1, column=2, rowspan=8, padx=5, pady=5, sticky="news")
 
-        # Define column headings
-        self.target_treeview.heading("uuid", text="UUID")
-        self.target_treeview.heading("displayName", text="Display Name")
-        self.target_treeview.heading("port", text="Port")
-        self.target_treeview.heading("databaseId", text="Database ID")
-        self.target_treeview.heading("username", text="Username")
-        self.target_treeview.heading("lastEditTime", text="Last Edit Time")
-        self.target_treeview.heading("status", text="Status")
-        self.target_treeview.heading("scope", text="Scope")
+        # Define column headings; clicking one sorts by it, clicking again reverses
+        self.column_titles = {
+            "uuid": "UUID",
+            "displayName": "Display Name",
+            "port": "Port",
+            "databaseId": "Database ID",
+            "username": "Username",
+            "lastEditTime": "Last Edit Time",
+            "status": "Status",
+            "scope": "Scope",
+        }
+        for column, title in self.column_titles.items():
+            self.target_treeview.heading(column, text=title, command=lambda c=column: self.sort_by(c))
 
         # Set column widths
         self.target_treeview.column("uuid", width=30, anchor="center")
@@ -124,132 +408,474 @@ class TargetManagerApp:
         self.target_treeview.column("status", width=150, anchor="center")
         self.target_treeview.column("scope", width=50, anchor="center")
         # Fetch button to populate the treeview
-        self.fetch_button = ttk.Button(self.form_frame, text="Fetch All Targets", command=self.fetch_all_targets)
-        self.fetch_button.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        self.table_bar = ttk.Frame(self.form_frame)
+        self.table_bar.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        self.table_bar.columnconfigure(2, weight=1)
+        self.fetch_button = ttk.Button(self.table_bar, text="Fetch All Targets", command=self.fetch_all_targets)
+        self.fetch_button.grid(row=0, column=0, padx=(0, 10), sticky="w")
+
+        # Filter box: plain words match anywhere, "status:valid" style terms match one column by prefix
+        ttk.Label(self.table_bar, text="Filter:").grid(row=0, column=1, sticky="e")
+        self.filter_entry = ttk.Entry(self.table_bar, textvariable=self.filter_var)
+        self.filter_entry.grid(row=0, column=2, padx=5, sticky="ew")
+        self.filter_var.trace_add("write", self.schedule_filter)
+        ttk.Label(self.table_bar, textvariable=self.view_count_var).grid(row=0, column=3, sticky="e")
 
         # Section 4: Delete Targets En Masse
         self.delete_section = ttk.LabelFrame(self.root, text="Delete Targets", padding="10")
         self.delete_section.grid(row=4, column=0, padx=10, pady=10, sticky="ew")
         self.delete_button = ttk.Button(self.delete_section, text="Delete CRITICAL Oracle Targets at once", command=self.delete_critical_targets)
         self.delete_button.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+
+        # Section 5: Progress of the running operation
+        self.status_frame = ttk.LabelFrame(self.root, text="Progress", padding="10")
+        self.status_frame.grid(row=5, column=0, padx=10, pady=10, sticky="ew")
+        self.progress_bar = ttk.Progressbar(self.status_frame, mode="determinate", length=300)
+        self.progress_bar.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        self.status_label = ttk.Label(self.status_frame, textvariable=self.status_var, anchor="w")
+        self.status_label.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.cancel_button = ttk.Button(self.status_frame, text="Cancel", command=self.cancel_job, state="disabled")
+        self.cancel_button.grid(row=0, column=2, padx=5, pady=5, sticky="e")
+        self.metrics_button = ttk.Button(self.status_frame, text="Show Metrics", command=self.show_metrics)
+        self.metrics_button.grid(row=0, column=3, padx=5, pady=5, sticky="e")
+
+        # Buttons that start network work; disabled while a job is running
+        self.action_buttons = [
+            self.create_targets_button,
+            self.change_button,
+            self.delete_selection_button,
+            self.fetch_button,
+            self.delete_button,
+        ]
     
     def upload_target_file(self):
         file_path = filedialog.askopenfilename(title="Select Target File", filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")])
         self.filepath.set(file_path) 
 
+    def set_busy(self, busy):
+        for button in self.action_buttons:
+            button.config(state="disabled" if busy else "normal")
+        self.cancel_button.config(state="normal" if busy else "disabled")
+        if busy:
+            self.progress_bar.config(value=0)
+            self.status_var.set("Working...")
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate")
+
+    def show_progress(self, done, total=None, message=""):
+        if total:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate", maximum=total, value=done)
+            self.status_var.set(f"{message} {done}/{total}".strip())
+        else:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+                self.progress_bar.start(20)
+            self.status_var.set(f"{message} {done}".strip())
+
+    def cancel_job(self):
+        self.jobs.cancel()
+        self.status_var.set("Cancelling...")
+
+    def on_close(self):
+        self.jobs.shutdown()
+        self.inventory.close()
+        self.root.destroy()
+
+    # Per-endpoint request counts, errors, retries and latency for this session
+    def show_metrics(self):
+        window = tk.Toplevel(self.root)
+        window.title("Request Metrics")
+        text = tk.Text(window, width=100, height=20, font="TkFixedFont")
+        text.grid(row=0, column=0, columnspan=4, padx=5, pady=5, sticky="news")
+
+        def refresh():
+            text.config(state="normal")
+            text.delete("1.0", tk.END)
+            text.insert(tk.END, metrics.summary())
+            text.config(state="disabled")
+
+        def save(dump, extension):
+            path = filedialog.asksaveasfilename(parent=window, defaultextension=extension)
+            if path:
+                dump(path)
+
+        def reset():
+            metrics.reset()
+            refresh()
+
+        ttk.Button(window, text="Refresh", command=refresh).grid(row=1, column=0, padx=5, pady=5, sticky="ew")
+        ttk.Button(window, text="Save JSON...", command=lambda: save(metrics.dump_json, ".json")).grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        ttk.Button(window, text="Save Prometheus...", command=lambda: save(metrics.dump_prometheus, ".prom")).grid(row=1, column=2, padx=5, pady=5, sticky="ew")
+        ttk.Button(window, text="Reset", command=reset).grid(row=1, column=3, padx=5, pady=5, sticky="ew")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(0, weight=1)
+        refresh()
+
+    # Snapshot the credentials on the main thread for use by a background job
+    def connection_settings(self):
+        return self.ipAddress_var.get(), self.username_var.get(), self.password_var.get(), self.token.get()
+
+    # Runs on the worker thread: log in if we don't have a token yet
+    def ensure_token(self, job, api_url, username, password, token):
+        if token:
+            return token
+        token = login(api_url, username, password)
+        if not token:
+            raise RuntimeError("Login failed. Check the IP address and credentials.")
+        job.call(self.token.set, token)
+        return token
+
+    def selected_targets(self):
+        return [self.env_targets.get(item) for item in self.target_treeview.selection() if item in self.env_targets]
+
+    # Filtering and sorting: the index works out which rows to show and in
+    # what order, and the table is rearranged with one set_children call.
+    # Rows hidden by the filter are only detached, so clearing it is as quick.
+    def view_active(self):
+        return bool(self.filter_var.get().strip()) or self.sort_column is not None
+
+    def schedule_filter(self, *_):
+        if self.filter_after_id is not None:
+            self.root.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.root.after(FILTER_DELAY_MS, self.refresh_view)
+
+    def sort_by(self, column):
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column, self.sort_descending = column, False
+        for name, title in self.column_titles.items():
+            arrow = (" \u25bc" if self.sort_descending else " \u25b2") if name == self.sort_column else ""
+            self.target_treeview.heading(name, text=title + arrow)
+        self.refresh_view()
+
+    def refresh_view(self):
+        self.filter_after_id = None
+        self.view_stale = False
+        treeview = self.target_treeview
+        query = self.filter_var.get().strip()
+        shown = self.target_index.view(query, self.sort_column, self.sort_descending)
+        treeview.set_children("", *shown)
+        # Don't leave hidden rows selected, they'd be changed or deleted unseen
+        if query:
+            visible = set(shown)
+            hidden = [item for item in treeview.selection() if item not in visible]
+            if hidden:
+                treeview.selection_remove(*hidden)
+        self.view_count_var.set(f"{len(shown)} of {len(self.target_index)} shown" if query else "")
+
     def fetch_all_targets(self):
-        if (self.token.get() == ""):
-            token = login(self.ipAddress_var.get(), self.username_var.get(), self.password_var.get())
-            self.token.set(token)
-        targets = get_targets(self.ipAddress_var.get(), self.token.get(), params={"target_type": "Oracle"})
-
-        # Clear the Treeview before populating with new data
-        for item in self.target_treeview.get_children():
-            self.target_treeview.delete(item)
-
-        # Populate Treeview with fetched data
-        for target in targets:
-            uuid = target["uuid"]
-            displayName = target["displayName"]
-            status = target["status"]
-            lastEditTime = target["lastEditTime"]
-            username = next((field["value"] for field in target["inputFields"] if field["name"] == "username"), None)
-            port = next((field["value"] for field in target["inputFields"] if field["name"] == "port"), None)
-            databaseId = next((field["value"] for field in target["inputFields"] if field["name"] == "databaseID"), None)
-            scope = next((field["value"] for field in target["inputFields"] if field["name"] == "targetEntities"), None)
-            self.target_treeview.insert("", "end", values=(
-                uuid,            
-                displayName,      
-                username,     
-                port,             
-                databaseId,
-                status,         
-                lastEditTime,
-                scope
-                ))
-    
+        api_url, username, password, token = self.connection_settings()
+        self.show_cached_targets(api_url)
+
+        def work(job):
+            token_ = self.ensure_token(job, api_url, username, password, token)
+            # Only new, changed and removed targets come back to the table
+            def on_changes(changed, removed):
+                job.call(self.queue_rows, changed)
+                if removed:
+                    job.call(self.queue_removal, removed)
+
+            counts = {"fetched": 0}
+            def on_page(count):
+                counts["fetched"] += count
+                job.progress(counts["fetched"], message="Fetched targets:")
+
+            return refresh_inventory(self.inventory, api_url, token_, on_changes=on_changes, on_page=on_page, cancel_event=job.cancel_event)
+
+        def done(summary):
+            self.status_var.set(f"Fetched {summary['fetched']} targets: {summary['changed']} new or changed, {summary['removed']} removed.")
+
+        def failed(e):
+            self.status_var.set("Fetch failed.")
+            messagebox.showerror("Error", f"Could not fetch targets: {e}")
+
+        self.jobs.submit(work, on_done=done, on_error=failed)
+
+    # Show the cached targets for api_url, replacing another instance's rows if needed
+    def show_cached_targets(self, api_url):
+        if api_url == self.shown_api_url:
+            return
+        self.shown_api_url = api_url
+        self.pending_rows.clear()
+        self.remove_rows([target.uuid for target in self.env_targets])
+        self.queue_rows(self.inventory.load(api_url))
+
+    # Table refresh: rows are diffed against what is already shown (keyed by
+    # UUID) and applied in chunks from the event loop, so only changed rows
+    # touch Tk and the window keeps responding while tens of thousands load.
+    def queue_rows(self, rows):
+        self.pending_rows.extend(rows)
+        self.schedule_apply_rows()
+
+    # Removals are queued behind any rows still waiting to be drawn
+    def queue_removal(self, uuids):
+        self.pending_rows.append(lambda: self.remove_rows(uuids))
+        self.schedule_apply_rows()
+
+    def schedule_apply_rows(self):
+        if not self.applying_rows:
+            self.applying_rows = True
+            self.root.after_idle(self.apply_rows)
+
+    def apply_rows(self):
+        treeview = self.target_treeview
+        for _ in range(TREEVIEW_CHUNK_SIZE):
+            if not self.pending_rows:
+                break
+            row = self.pending_rows.popleft()
+            if callable(row):
+                row()
+                continue
+            uuid = row[0]
+            current = self.env_targets.get(uuid)
+            if current is not None and current.row() == tuple(row):
+                continue
+            if current is None:
+                treeview.insert("", "end", iid=uuid, values=display_row(row))
+            else:
+                treeview.item(uuid, values=display_row(row))
+            target = Target.from_row(row)
+            self.env_targets.add(target)
+            self.target_index.add(target)
+            self.view_stale = True
+
+        if self.pending_rows:
+            self.root.after(1, self.apply_rows)
+        else:
+            self.applying_rows = False
+            # New rows went in at the end; put the table back in filter and sort order
+            if self.view_stale and self.view_active():
+                self.refresh_view()
+
+    def remove_rows(self, uuids):
+        uuids = [uuid for uuid in uuids if uuid in self.env_targets]
+        if uuids:
+            self.target_treeview.delete(*uuids)
+        for uuid in uuids:
+            self.env_targets.remove(uuid)
+            self.target_index.remove(uuid)
+        if uuids and self.filter_var.get().strip():
+            self.view_count_var.set(f"{len(self.target_treeview.get_children())} of {len(self.target_index)} shown")
+
     def show_selected_json(self):
-        selected_items = self.target_treeview.selection()
-        selected_targets = []
-        
-        for item in selected_items:
-            target_data = {col: self.target_treeview.item(item, "values")[i] for i, col in enumerate(self.target_treeview["columns"])}
-            selected_targets.append(target_data)
-        
-        if (self.token.get() == ""):
-            token = login(self.ipAddress_var.get(), self.username_var.get(), self.password_var.get())
-            self.token.set(token)
-
-        for selected_target in selected_targets:
-            input_fields = []
-
-            if self.db_username_var.get():
-                input_fields.append({"name": "username", "value": self.db_username_var.get()})
-            if self.db_password_var.get():
-                input_fields.append({"name": "password", "value": self.db_password_var.get()})
-            if self.port_var.get():
-                input_fields.append({"name": "port", "value": self.port_var.get()})
-            if self.db_ID_var.get(): 
-                input_fields.append({"name": "databaseID", "value": self.db_ID_var.get()})
-            if self.full_validation_var.get():
-                input_fields.append({"name": "fullValidation", "value": self.full_validation_var.get()})
-
-            data = {
-                "category": "Applications and Databases",
-                "type": "Oracle",  
-                "uuid": selected_target["uuid"],
-                "inputFields": input_fields,
-            }
-            update_target(self.ipAddress_var.get(), self.token.get(), selected_target["uuid"], data)
-        messagebox.showinfo("Targets Updated", "Selected targets have been updated with the set credentials. Check Turbo UI.")
+        selected_targets = self.selected_targets()
+        api_url, username, password, token = self.connection_settings()
+
+        input_fields = []
+
+        if self.db_username_var.get():
+            input_fields.append({"name": "username", "value": self.db_username_var.get()})
+        if self.db_password_var.get():
+            input_fields.append({"name": "password", "value": self.db_password_var.get()})
+        if self.port_var.get():
+            input_fields.append({"name": "port", "value": self.port_var.get()})
+        if self.db_ID_var.get(): 
+            input_fields.append({"name": "databaseID", "value": self.db_ID_var.get()})
+        if self.full_validation_var.get():
+            input_fields.append({"name": "fullValidation", "value": self.full_validation_var.get()})
+
+        rediscover = self.rediscover_var.get()
+
+        def work(job):
+            token_ = self.ensure_token(job, api_url, username, password, token)
+            updates = {}
+            for selected_target in selected_targets:
+                updates[selected_target.uuid] = {
+                    "category": "Applications and Databases",
+                    "type": "Oracle",  
+                    "uuid": selected_target.uuid,
+                    "inputFields": input_fields,
+                }
+            counts = {"update": 0, "rediscover": 0}
+
+            def on_result(phase, uuid, result):
+                counts[phase] += 1
+                message = "Updating targets:" if phase == "update" else "Rediscovering targets:"
+                job.progress(counts[phase], len(updates), message)
+
+            return bulk_update_targets(api_url, token_, updates, rediscover=rediscover, on_result=on_result, cancel_event=job.cancel_event)
+
+        def done(report):
+            report = report or {}
+            updated = count_status(report, "updated")
+            self.status_var.set(f"Updated {updated} of {len(selected_targets)} targets.")
+            problems = [f"{uuid}: {result['error'] or result['status']}" for uuid, result in report.items()
+                        if result["status"] != "updated" or result["rediscover"] == "failed"]
+            message = f"{updated} of {len(selected_targets)} selected targets have been updated with the set credentials. Check Turbo UI."
+            if problems:
+                messagebox.showwarning("Targets Updated", message + "\n\n" + "\n".join(problems[:20]))
+            else:
+                messagebox.showinfo("Targets Updated", message)
+
+        self.jobs.submit(work, on_done=done)
         
     def delete_selected_targets(self):
-        if (self.token.get() == ""):
-            token = login(self.ipAddress_var.get(), self.username_var.get(), self.password_var.get())
-            self.token.set(token)
         confirm = messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete the selected targets?")
-        if confirm:
-            selected_items = self.target_treeview.selection()
-            selected_targets = []
-            
-            for item in selected_items:
-                target_data = {col: self.target_treeview.item(item, "values")[i] for i, col in enumerate(self.target_treeview["columns"])}
-                selected_targets.append(target_data)
+        if not confirm:
+            messagebox.showinfo("Deletion Cancelled", "The deletion process was cancelled.")
+            return
 
-            for selected_target in selected_targets:
-                uuid = selected_target.get("uuid")
-                scope_uuid = selected_target.get("scope")
-                # delete the target
-                delete_target(self.ipAddress_var.get(), self.token.get(), uuid) 
-                # delete the associated group
-                # delete_scope(self.ipAddress_var.get(), self.token.get(), scope_uuid)
-            messagebox.showinfo("Deleted", "The selected targets have been deleted.")
+        selected_targets = self.selected_targets()
+        api_url, username, password, token = self.connection_settings()
+
+        def work(job):
+            token_ = self.ensure_token(job, api_url, username, password, token)
+            uuids = [selected_target.uuid for selected_target in selected_targets]
+            # delete the associated group
+            # delete_scope(api_url, token_, scope_uuid)
+            counts = {"done": 0}
+
+            def on_result(uuid, result):
+                counts["done"] += 1
+                if result["status"] == "deleted":
+                    self.inventory.remove(api_url, [uuid])
+                    job.call(self.queue_removal, [uuid])
+                job.progress(counts["done"], len(uuids), "Deleting targets:")
+
+            return bulk_delete_targets(api_url, token_, uuids, on_result=on_result, cancel_event=job.cancel_event)
+
+        def done(report):
+            self.status_var.set(f"Deleted {count_status(report, 'deleted')} of {len(selected_targets)} targets.")
+            self.show_delete_report("Deleted", report)
+
+        self.jobs.submit(work, on_done=done)
+
+    # Summarise a bulk delete report in a message box
+    def show_delete_report(self, title, report):
+        report = report or {}
+        deleted = count_status(report, "deleted")
+        lines = [f"{deleted} of {len(report)} targets deleted."]
+        problems = [(uuid, result) for uuid, result in report.items() if result["status"] != "deleted"]
+        for uuid, result in problems[:20]:
+            lines.append(f"{uuid}: {result['status']} ({result['status_code'] or result['error']})")
+        if len(problems) > 20:
+            lines.append(f"...and {len(problems) - 20} more.")
+        if problems:
+            messagebox.showwarning(title, "\n".join(lines))
         else:
-            messagebox.showinfo("Deletion Cancelled", "The deletion process was cancelled.")
+            messagebox.showinfo(title, lines[0])
 
     def delete_critical_targets(self):
-        if self.token.get() == "":
-            token = login(self.ipAddress_var.get(), self.username_var.get(), self.password_var.get())
-            self.token.set(token)
         confirm = messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete all CRITICAL targets?")
-        if confirm:
-            delete_oracle_targets(self.ipAddress_var.get(), self.token.get()) 
-            messagebox.showinfo("Deleted", "The selected targets have been deleted.")
-        else:
+        if not confirm:
             messagebox.showinfo("Deletion Cancelled", "The deletion process was cancelled.")
+            return
+
+        api_url, username, password, token = self.connection_settings()
+
+        def work(job):
+            token_ = self.ensure_token(job, api_url, username, password, token)
+            counts = {"done": 0}
+
+            def on_result(uuid, result):
+                counts["done"] += 1
+                if result["status"] == "deleted":
+                    self.inventory.remove(api_url, [uuid])
+                    job.call(self.queue_removal, [uuid])
+                job.progress(counts["done"], message="Deleting CRITICAL targets:")
+
+            return delete_oracle_targets(api_url, token_, on_result=on_result, cancel_event=job.cancel_event)
+
+        def done(report):
+            self.status_var.set(f"Deleted {count_status(report, 'deleted')} CRITICAL targets.")
+            self.show_delete_report("Deleted", report)
+
+        self.jobs.submit(work, on_done=done)
 
     def create_targets(self):
         # Add logic to create new targets based on form entries and populate them into the treeview.
-        if (self.token.get() == ""):
-            token = login(self.ipAddress_var.get(), self.username_var.get(), self.password_var.get())
-            self.token.set(token)
-        payload = oracle_csv_to_json(self.ipAddress_var.get(), self.token.get(), self.filepath.get(), header=True)
-        if payload:
-            create_oracle_targets(self.ipAddress_var.get(), self.token.get(), params=payload) 
-        else:
-            messagebox.showinfo("Error", "Could not create the targets, check the CSV file for correct formatting.")
+        filepath = self.filepath.get()
+        api_url, username, password, token = self.connection_settings()
+        validate = self.validate_var.get()
+
+        if not os.path.isfile(filepath):
+            messagebox.showinfo("Error", "Choose the CSV file of targets to create first.")
             return
-        messagebox.showinfo("Created", "Targets from CSV have been created, check Turbonomic UI.")
+
+        # Offer to pick up an earlier run of this file against this server that didn't finish
+        path = journal_path(api_url, filepath)
+        try:
+            journal = JobJournal(path, api_url)
+            if journal.resumed:
+                resume = messagebox.askyesno("Resume", "An earlier run of this file against this server did not finish.\n\n"
+                                                       "Resume it? Targets it already created will be skipped.\n"
+                                                       "Choose No to start over from the first row.")
+                if not resume:
+                    journal.close()
+                    os.remove(path)
+                    journal = JobJournal(path, api_url)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not open the progress journal {path}: {e}")
+            return
+
+        def work(job):
+            results = []
+            try:
+                token_ = self.ensure_token(job, api_url, username, password, token)
+                rows = iter_csv_rows(filepath, header=True)
+                for result in stream_oracle_targets(api_url, token_, rows, journal=journal):
+                    results.append(result)
+                    job.progress(len(results), message="Targets processed:")
+                    if job.cancelled:
+                        break
+            finally:
+                journal.close()
+            # Nothing left to resume once every row has been created
+            if results and not job.cancelled and all(result["status"] == "created" for result in results):
+                os.remove(path)
+
+            keys = created_keys(results)
+            if validate and keys and not job.cancelled:
+                settled = {"done": 0}
+
+                def on_result(key, result):
+                    settled["done"] += 1
+                    job.progress(settled["done"], len(keys), "Validating targets:")
+
+                job.progress(0, len(keys), "Validating targets:")
+                validation = track_validation(api_url, token_, keys, on_result=on_result, cancel_event=job.cancel_event) or {}
+                for result in results:
+                    outcome = validation.get(result["uuid"] or result["targetId"])
+                    if outcome:
+                        result["validation"] = outcome["status"]
+                        result["target_status"] = outcome["target_status"]
+            return results
+
+        def done(results):
+            if not results:
+                messagebox.showinfo("Error", "Could not create the targets, check the CSV file for correct formatting.")
+                return
+            failed = [result["targetId"] for result in results if result["status"] != "created"]
+            resumed = sum(1 for result in results if result.get("resumed"))
+            self.status_var.set(f"Created {len(results) - len(failed)} of {len(results)} targets" + (f" ({resumed} in an earlier run)." if resumed else "."))
+            # Created targets that then failed validation or didn't settle in time
+            unvalidated = [f"{result['targetId']}: {result['target_status'] or result['validation'].replace('_', ' ')}"
+                           for result in results if result.get("validation") not in (None, "validated")]
+            validated = sum(1 for result in results if result.get("validation") == "validated")
+            if failed or unvalidated:
+                lines = [f"{len(results) - len(failed)} of {len(results)} targets created."]
+                if failed:
+                    lines += ["", "Failed:"] + [str(target_id) for target_id in failed[:20]]
+                if unvalidated:
+                    lines += ["", f"{validated} validated. Not validated:"] + unvalidated[:20]
+                messagebox.showwarning("Created", "\n".join(lines))
+                return
+            if validated:
+                messagebox.showinfo("Created", f"All {len(results)} targets from CSV have been created and validated.")
+                return
+            messagebox.showinfo("Created", f"All {len(results)} targets from CSV have been created, check Turbonomic UI.")
+
+        def failed(e):
+            if isinstance(e, (OSError, UnicodeDecodeError)):
+                messagebox.showinfo("Error", f"Could not read the CSV file: {e}")
+            else:
+                messagebox.showerror("Error", str(e))
+
+        if not self.jobs.submit(work, on_done=done, on_error=failed):
+            journal.close()
 
 # ---
 
@@ -258,10 +884,13 @@ def parse_args():
     parser.add_argument("--ip", type=str, help="IP address of the target, please include https:// at the front.", default="https://url_here")
     parser.add_argument("--username", type=str, help="Username for login", default="")
     parser.add_argument("--password", type=str, help="Password for login", default="")
+    parser.add_argument("--log-file", type=str, help="Also write the log to this file (rotated at 10 MB)", default=None)
+    parser.add_argument("--request-log", type=str, help="Write one JSON line per HTTP request to this file (rotated at 10 MB)", default=None)
     return parser.parse_args()
 
 if __name__ == "__main__":
     args = parse_args()
+    setup_logging(logging.INFO, log_file=args.log_file, request_log=args.request_log)
     root = tk.Tk()
     app = TargetManagerApp(root, args.ip, args.username, args.password)
     root.mainloop()
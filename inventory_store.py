@@ -0,0 +1,150 @@
+import os
+import sqlite3
+import threading
+import logging
+import time
+from oracle_script import iter_target_pages, Target, TARGET_JSON_FIELDS, LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME + ".inventory")
+
+# Local copy of the Oracle target list so the GUI can draw the table straight
+# away on startup, and a refresh only has to write (and redraw) what changed.
+DEFAULT_INVENTORY_PATH = os.path.join(os.path.expanduser("~"), ".turbo_script_tool", "inventory.sqlite3")
+
+# Stored fields, in the order rows are handed back
+INVENTORY_FIELDS = ("uuid", "display_name", "username", "port", "database_id", "status", "last_edit_time", "scope")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS targets (
+    api_url TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    display_name TEXT,
+    username TEXT,
+    port TEXT,
+    database_id TEXT,
+    status TEXT,
+    last_edit_time TEXT,
+    scope TEXT,
+    PRIMARY KEY (api_url, uuid)
+);
+CREATE TABLE IF NOT EXISTS refresh_state (
+    api_url TEXT PRIMARY KEY,
+    watermark TEXT,
+    refreshed_at REAL
+);
+"""
+
+# Pull the stored fields out of a target from /api/v3/targets (raw JSON or a Target)
+def inventory_row(target):
+    return (target if isinstance(target, Target) else Target.from_json(target)).row()
+
+class InventoryStore:
+    def __init__(self, path=DEFAULT_INVENTORY_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        # Shared between the Tk thread and the background job thread
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    # All stored rows for one Turbonomic instance, ordered by display name
+    def load(self, api_url):
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {', '.join(INVENTORY_FIELDS)} FROM targets WHERE api_url = ? ORDER BY display_name",
+                (api_url,))
+            return cursor.fetchall()
+
+    def watermark(self, api_url):
+        with self._lock:
+            row = self._conn.execute("SELECT watermark, refreshed_at FROM refresh_state WHERE api_url = ?", (api_url,)).fetchone()
+        return row if row else (None, None)
+
+    # Upsert only the rows that differ from what is stored. Returns the changed rows.
+    def apply(self, api_url, rows):
+        with self._lock:
+            stored = {}
+            uuids = [row[0] for row in rows]
+            # Look the page's rows up in chunks to stay under SQLite's parameter limit
+            for start in range(0, len(uuids), 500):
+                chunk = uuids[start:start + 500]
+                cursor = self._conn.execute(
+                    f"SELECT {', '.join(INVENTORY_FIELDS)} FROM targets WHERE api_url = ? AND uuid IN ({', '.join('?' * len(chunk))})",
+                    [api_url, *chunk])
+                for row in cursor:
+                    stored[row[0]] = row
+
+            changed = [row for row in rows if stored.get(row[0]) != row]
+            if changed:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO targets (api_url, {', '.join(INVENTORY_FIELDS)}) VALUES (?, {', '.join('?' * len(INVENTORY_FIELDS))})",
+                        [(api_url, *row) for row in changed])
+            return changed
+
+    def remove(self, api_url, uuids):
+        uuids = list(uuids)
+        if not uuids:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM targets WHERE api_url = ? AND uuid = ?", [(api_url, uuid) for uuid in uuids])
+
+    # Drop every stored row for api_url that wasn't in a complete listing. Returns the removed UUIDs.
+    def prune(self, api_url, seen_uuids):
+        with self._lock:
+            stored = [row[0] for row in self._conn.execute("SELECT uuid FROM targets WHERE api_url = ?", (api_url,))]
+        removed = [uuid for uuid in stored if uuid not in seen_uuids]
+        self.remove(api_url, removed)
+        return removed
+
+    def mark_refreshed(self, api_url, watermark):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO refresh_state (api_url, watermark, refreshed_at) VALUES (?, ?, ?)",
+                               (api_url, watermark, time.time()))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# Bring the stored inventory for api_url up to date. Targets are compared on
+# every stored field (lastEditTime covers edits, status is compared as well
+# since it changes without an edit) so only new or changed rows are written
+# and reported. on_changes(changed_rows, removed_uuids) is called per page and
+# once more with the removals after a complete listing; on_page(count) after
+# every page. Returns a summary.
+def refresh_inventory(store, api_url, token, params={"target_type": "Oracle"}, on_changes=None, on_page=None, cancel_event=None):
+    previous_watermark, _ = store.watermark(api_url)
+    seen = set()
+    summary = {"fetched": 0, "changed": 0, "removed": 0, "edited_since_last_refresh": 0, "complete": False}
+    watermark = previous_watermark
+
+    for page in iter_target_pages(api_url, token, params=params, fields=TARGET_JSON_FIELDS):
+        rows = [inventory_row(target) for target in page]
+        seen.update(row[0] for row in rows)
+        changed = store.apply(api_url, rows)
+        summary["fetched"] += len(rows)
+        summary["changed"] += len(changed)
+        for row in rows:
+            last_edit_time = row[6]
+            if last_edit_time and (previous_watermark is None or last_edit_time > previous_watermark):
+                summary["edited_since_last_refresh"] += 1
+            if last_edit_time and (watermark is None or last_edit_time > watermark):
+                watermark = last_edit_time
+        if on_changes and changed:
+            on_changes(changed, [])
+        if on_page:
+            on_page(len(rows))
+        if cancel_event and cancel_event.is_set():
+            return summary
+
+    # Only a complete listing tells us which targets no longer exist
+    removed = store.prune(api_url, seen)
+    summary["removed"] = len(removed)
+    summary["complete"] = True
+    if on_changes and removed:
+        on_changes([], removed)
+    store.mark_refreshed(api_url, watermark)
+    logger.info("Inventory refresh for %s: %s", api_url, summary)
+    return summary
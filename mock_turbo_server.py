@@ -0,0 +1,274 @@
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Local stand-in for the parts of the Turbonomic API that oracle_script.py
+# uses (/login, /targets, /search, /groups), for benchmarking without a real
+# instance. Latency, error rate and inventory size are configurable.
+
+class MockTurbonomic:
+    def __init__(self, vms=1000, targets=0, critical_ratio=0.0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, retry_after=None, validation_delay=0.0, validation_failure_ratio=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        # New targets report "Validating" for validation_delay seconds before settling
+        self.validation_delay = validation_delay
+        self.validation_failure_ratio = validation_failure_ratio
+        self.settling = {}  # uuid -> (settles_at, final status)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.sessions = set()
+        self.vms = {}
+        self.groups = {}
+        self.targets = {}
+        self.request_counts = {}
+
+        for i in range(vms):
+            self._add(self.vms, {"displayName": mock_vm_name(i), "className": "VirtualMachine"})
+        for i in range(targets):
+            server, instance = mock_vm_name(i % max(vms, 1)), f"db{i}"
+            status = "Validation failed" if self.random.random() < critical_ratio else "Validated"
+            self._add_target({
+                "category": "Applications and Databases",
+                "type": "Oracle",
+                "inputFields": [
+                    {"name": "targetId", "value": f"On-Prem - Oracle - {server}-{instance}"},
+                    {"name": "username", "value": "oracle"},
+                    {"name": "port", "value": "1521"},
+                    {"name": "databaseID", "value": instance},
+                    {"name": "fullValidation", "value": "false"},
+                ],
+            }, status)
+
+    def _add(self, store, record):
+        record["uuid"] = str(uuid.uuid4())
+        store[record["uuid"]] = record
+        return record
+
+    def _add_target(self, payload, status="Validated"):
+        fields = [field for field in payload.get("inputFields", []) if field["name"] != "password"]
+        target_id = next((field["value"] for field in fields if field["name"] == "targetId"), None)
+        return self._add(self.targets, {
+            "displayName": target_id,
+            "category": payload.get("category"),
+            "type": payload.get("type"),
+            "status": status,
+            "lastEditTime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "inputFields": fields,
+        })
+
+    # A target created through the API, validating first if validation_delay is set
+    def create_target(self, payload):
+        if not self.validation_delay:
+            return self._add_target(payload)
+        target = self._add_target(payload, "Validating")
+        failed = self.random.random() < self.validation_failure_ratio
+        self.settling[target["uuid"]] = (time.monotonic() + self.validation_delay, "Validation failed" if failed else "Validated")
+        return target
+
+    # Move targets whose validation time has passed to their final status
+    def settle(self):
+        now = time.monotonic()
+        for uuid, (settles_at, status) in list(self.settling.items()):
+            if settles_at <= now:
+                del self.settling[uuid]
+                if uuid in self.targets:
+                    self.targets[uuid]["status"] = status
+
+    def count(self, method, endpoint):
+        with self.lock:
+            key = f"{method} {endpoint}"
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def reset_counts(self):
+        with self.lock:
+            self.request_counts = {}
+
+    def total_requests(self):
+        with self.lock:
+            return sum(self.request_counts.values())
+
+    def delay(self):
+        wait = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if wait:
+            time.sleep(wait)
+
+    def should_fail(self):
+        return self.error_rate and self.random.random() < self.error_rate
+
+def mock_vm_name(i):
+    return f"MOCKVM{i:06d}"
+
+class MockTurboHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer writes so headers and body go out together (avoids Nagle/delayed-ACK stalls)
+    wbufsize = 64 * 1024
+    api = None  # set on the subclass made by make_server
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, code, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        if "json" not in (self.headers.get("Content-Type") or ""):
+            return {name: values[0] for name, values in parse_qs(raw.decode()).items()}
+        return json.loads(raw)
+
+    def send_page(self, items, query):
+        limit = int(query.get("limit", ["0"])[0] or 0)
+        if not limit:
+            return self.send_json(200, items)
+        start = int(query.get("cursor", ["0"])[0] or 0)
+        headers = {"X-Total-Record-Count": str(len(items))}
+        if start + limit < len(items):
+            headers["X-Next-Cursor"] = str(start + limit)
+        self.send_json(200, items[start:start + limit], headers)
+
+    def handle_request(self, method):
+        api = self.api
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = url.path.rstrip("/").split("/")  # ["", "api", "v3", endpoint, ...]
+        endpoint = parts[3] if len(parts) > 3 else ""
+        body = self.read_body()
+        api.count(method, endpoint)
+        api.delay()
+
+        if api.should_fail():
+            headers = {"Retry-After": str(api.retry_after)} if api.retry_after is not None else {}
+            return self.send_json(503, {"error": "Service unavailable"}, headers)
+
+        if endpoint == "login" and method == "POST":
+            session = f"JSESSIONID={uuid.uuid4().hex}"
+            with api.lock:
+                api.sessions.add(session)
+            return self.send_json(200, {"username": "mock"}, {"Set-Cookie": f"{session}; Path=/; HttpOnly"})
+
+        with api.lock:
+            authorised = self.headers.get("cookie") in api.sessions
+        if not authorised:
+            return self.send_json(401, {"error": "Unauthorized"})
+
+        if endpoint == "search" and method == "GET":
+            text = query.get("q", [""])[0].lower()
+            types = query.get("types", [])
+            with api.lock:
+                source = api.groups if "Group" in types else api.vms
+                items = [record for record in source.values() if text in record["displayName"].lower()]
+            return self.send_page(items, query)
+
+        if endpoint == "groups" and method == "POST":
+            with api.lock:
+                group = api._add(api.groups, {"displayName": body["displayName"], "className": "Group",
+                                              "memberUuidList": body.get("memberUuidList", [])})
+            return self.send_json(200, group)
+
+        if endpoint == "targets" and len(parts) == 4:
+            if method == "GET":
+                target_type = query.get("target_type", [""])[0].lower()
+                critical = query.get("health_state", [""])[0].upper() == "CRITICAL"
+                with api.lock:
+                    api.settle()
+                    items = [target for target in api.targets.values()
+                             if (not target_type or str(target["type"]).lower() == target_type)
+                             and (not critical or target["status"] != "Validated")]
+                return self.send_page(items, query)
+            if method == "POST":
+                with api.lock:
+                    target = api.create_target(body or {})
+                return self.send_json(200, target)
+
+        if endpoint == "targets" and len(parts) == 5:
+            target_uuid = parts[4]
+            with api.lock:
+                target = api.targets.get(target_uuid)
+                if target is None:
+                    return self.send_json(404, {"error": f"Target {target_uuid} not found"})
+                if method == "DELETE":
+                    del api.targets[target_uuid]
+                    return self.send_json(200, {})
+                if method == "PUT":
+                    updates = {field["name"]: field["value"] for field in (body or {}).get("inputFields", []) if field["name"] != "password"}
+                    for field in target["inputFields"]:
+                        if field["name"] in updates:
+                            field["value"] = updates.pop(field["name"])
+                    target["inputFields"].extend({"name": name, "value": value} for name, value in updates.items())
+                    target["lastEditTime"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                    return self.send_json(200, target)
+                if method == "POST" and query.get("rediscover"):
+                    return self.send_json(200, target)
+                if method == "GET":
+                    return self.send_json(200, target)
+
+        self.send_json(404, {"error": f"No mock for {method} {url.path}"})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+
+def make_server(api, host="127.0.0.1", port=0):
+    handler = type("BoundMockTurboHandler", (MockTurboHandler,), {"api": api})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+# Start a mock server on a background thread. Returns (server, base_url).
+def start_mock_server(api, host="127.0.0.1", port=0):
+    server = make_server(api, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mock Turbonomic API server for benchmarking")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--vms", type=int, default=1000, help="Number of VirtualMachines to serve")
+    parser.add_argument("--targets", type=int, default=0, help="Number of existing Oracle targets")
+    parser.add_argument("--critical-ratio", type=float, default=0.0, help="Share of existing targets in a failed state")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds, up to this much")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds sent with injected 503s")
+    parser.add_argument("--validation-delay", type=float, default=0.0, help="Seconds new targets stay in Validating")
+    parser.add_argument("--validation-failure-ratio", type=float, default=0.0, help="Share of new targets that fail validation")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    api = MockTurbonomic(vms=args.vms, targets=args.targets, critical_ratio=args.critical_ratio, latency=args.latency,
+                         jitter=args.jitter, error_rate=args.error_rate, retry_after=args.retry_after,
+                         validation_delay=args.validation_delay, validation_failure_ratio=args.validation_failure_ratio)
+    server = make_server(api, args.host, args.port)
+    print(f"Mock Turbonomic API listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
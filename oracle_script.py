@@ -1,14 +1,42 @@
 import requests
 import logging
+import logging.handlers
+import atexit
+import queue
 import csv
-from requests.exceptions import HTTPError, Timeout, RequestException
+import os
+import threading
+import time
+import random
+import json
+import codecs
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, Timeout, RequestException, ConnectionError, ConnectTimeout
+from urllib3.exceptions import NewConnectionError
 
-# Set up logging
-# Logging turned off because level set to critical!
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-logging.captureWarnings(True)
-logger = logging.getLogger()
+
+# Logging goes to this module's own logger rather than the root logger, and
+# nothing is printed until the application calls setup_logging(), so
+# importing this module never changes anyone else's logging.
+LOGGER_NAME = "turbo_script_tool"
+logger = logging.getLogger(LOGGER_NAME)
+logger.addHandler(logging.NullHandler())
+
+# One structured record per HTTP request (method, endpoint, status, latency,
+# bytes). Only built when setup_logging() is given a request log file.
+REQUEST_LOGGER_NAME = LOGGER_NAME + ".requests"
+request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+request_logger.setLevel(logging.WARNING)
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
 
 # Disable SSL warnings for insecure requests
 TARGETS_ENDPOINT = "/api/v3/targets"
@@ -18,17 +46,613 @@ GROUPS_ENDPOINT = "/api/v3/groups"
 
 # Configurations for requests
 TIMEOUT = 10  # seconds
-RETRIES = 1  
+RETRIES = 4  # attempts per request, including the first
+CREATE_TIMEOUT = 120  # seconds, target creation blocks until the server has validated the target
+MAX_WORKERS = 8  # requests in flight at once for bulk operations
+PAGE_SIZE = 500  # records per page for paginated GETs
+JSON_CHUNK_SIZE = 64 * 1024  # bytes read at a time when decoding a streamed JSON array
+REDISCOVER_WORKERS = 2  # rediscoveries in flight at once after a bulk update
+REDISCOVER_RATE = 2  # rediscoveries started per second after a bulk update
+
+# Configurations for the server -> VM/group resolution cache
+RESOLUTION_CACHE_SIZE = 10000  # entries per cache
+RESOLUTION_CACHE_TTL = 15 * 60  # seconds
+
+# Configurations for the pooled HTTP session
+POOL_CONNECTIONS = 4  # number of distinct hosts to keep pools for
+POOL_MAXSIZE = 16  # connections kept alive per host
+KEEP_ALIVE = True
+DEFAULT_HEADERS = {"Accept": "application/json"}
+
+# Configurations for retries and adaptive concurrency
+BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+BACKOFF_MAX = 30  # seconds, longest wait between two attempts (also caps Retry-After)
+RETRY_STATUSES = (429, 503)  # the server turned the request away: worth retrying for any method
+IDEMPOTENT_RETRY_STATUSES = (500, 502, 504)  # only retried when repeating the request is harmless
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+THROTTLE_STATUSES = (429, 502, 503, 504)  # the server is overloaded: back off concurrency
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 16  # ceiling for the adaptive limiter, keep <= POOL_MAXSIZE
+
+# Configurations for tracking new targets until they validate
+VALIDATION_TIMEOUT = 10 * 60  # seconds to wait for new targets to settle
+VALIDATION_POLL_INTERVAL = 5  # seconds before the first status poll, doubled after every poll
+VALIDATION_POLL_MAX = 60  # seconds, longest wait between two polls
+VALIDATED_STATUSES = ("validated",)
+VALIDATION_PENDING_MARKERS = ("validating", "discovering", "in progress", "pending", "unknown")  # status still settling
+
+# Configurations for the auth session
+SESSION_IDLE_TIMEOUT = 25 * 60  # seconds, log in again before Turbonomic's idle timeout
+AUTH_FAILURE_CODES = (401, 403)  # responses that mean the auth cookie is no longer accepted
+
+# Decides which failures are worth another attempt and how long to wait first.
+# 429/503 and failures to connect (the request was never sent) are retried
+# for any method. A 500, 502 or 504, a read timeout or a connection dropped
+# after sending only for idempotent methods: a proxy's 502/504 or a lost
+# connection doesn't mean the server did nothing, and replaying a POST could
+# create the target twice. Everything else (400, 404, ...) fails straight away.
+class RetryPolicy:
+    def __init__(self, attempts=RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX,
+                 retry_statuses=RETRY_STATUSES, idempotent_retry_statuses=IDEMPOTENT_RETRY_STATUSES):
+        self.attempts = attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.idempotent_retry_statuses = idempotent_retry_statuses
+
+    def is_retryable(self, method, response=None, error=None):
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if response is not None:
+            if response.status_code in self.retry_statuses:
+                return True
+            return idempotent and response.status_code in self.idempotent_retry_statuses
+        if _not_sent(error):
+            return True
+        if isinstance(error, (ConnectionError, Timeout)):
+            return idempotent
+        return False
+
+    # Seconds to wait before the given retry (1 = first retry): the server's
+    # Retry-After when it sent one, else exponential backoff with full jitter
+    def delay(self, retry, response=None):
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (retry - 1))))
+
+# Whether a request failed before any of it reached the server: the
+# connection couldn't be opened (refused, DNS, connect timeout)
+def _not_sent(error):
+    if isinstance(error, ConnectTimeout):
+        return True
+    if not isinstance(error, ConnectionError) or not error.args:
+        return False
+    reason = getattr(error.args[0], "reason", error.args[0])
+    return isinstance(reason, NewConnectionError)
+
+# Seconds asked for by a Retry-After header (delta-seconds or an HTTP date)
+def _retry_after(response):
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Caps the requests in flight to one server and adapts the cap AIMD style:
+# +1/limit per success (so about +1 per full round of requests), halved when
+# the server signals overload. At most one cut per cooldown so a burst of
+# failures from the same overload doesn't collapse the limit to the floor.
+class AdaptiveLimiter:
+    def __init__(self, initial=MAX_WORKERS, minimum=MIN_CONCURRENCY, maximum=MAX_CONCURRENCY,
+                 decrease=0.5, cooldown=1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.throttled = 0
+        self._last_cut = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    # outcome is "success", "throttled" or "error" (no change to the limit)
+    def release(self, outcome):
+        with self._cond:
+            self.in_flight -= 1
+            if outcome == "success":
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            elif outcome == "throttled":
+                self.throttled += 1
+                now = time.monotonic()
+                if now - self._last_cut >= self.cooldown:
+                    self._last_cut = now
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {"limit": round(self.limit, 2), "in_flight": self.in_flight, "throttled": self.throttled}
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# API endpoint a URL belongs to: login, targets, search, groups, ...
+def endpoint_name(url):
+    parts = urlsplit(url).path.strip("/").split("/")
+    return parts[2] if len(parts) > 2 and parts[0] == "api" else (parts[-1] or "unknown")
+
+# Per method+endpoint request counts, errors, retries, bytes received and a
+# latency histogram, plus the duration of named run phases. Shared by every
+# client; dump as JSON or in Prometheus text format at the end of a run.
+class MetricsCollector:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = {}  # (method, endpoint) -> stats dict
+            self.phases = {}  # phase name -> seconds
+            self.started_at = time.time()
+
+    def _stats(self, method, endpoint):
+        key = (method.upper(), endpoint)
+        stats = self.requests.get(key)
+        if stats is None:
+            stats = {"count": 0, "errors": 0, "retries": 0, "bytes": 0, "latency_sum": 0.0,
+                     "buckets": [0] * (len(self.buckets) + 1)}
+            self.requests[key] = stats
+        return stats
+
+    def record_request(self, method, url, latency, status_code=None, error=False, size=0):
+        with self._lock:
+            stats = self._stats(method, endpoint_name(url))
+            stats["count"] += 1
+            stats["errors"] += int(bool(error) or (status_code is not None and status_code >= 400))
+            stats["bytes"] += size or 0
+            stats["latency_sum"] += latency
+            for i, bound in enumerate(self.buckets):
+                if latency <= bound:
+                    stats["buckets"][i] += 1
+                    break
+            else:
+                stats["buckets"][-1] += 1
+
+    def record_retry(self, method, url):
+        with self._lock:
+            self._stats(method, endpoint_name(url))["retries"] += 1
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    # Approximate latency percentile (bucket upper bound) from a histogram
+    def _percentile(self, stats, pct):
+        target = stats["count"] * pct / 100.0
+        seen = 0
+        for i, count in enumerate(stats["buckets"]):
+            seen += count
+            if count and seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return None
+
+    def to_dict(self):
+        with self._lock:
+            requests_ = []
+            for (method, endpoint), stats in sorted(self.requests.items()):
+                requests_.append({
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "bytes": stats["bytes"],
+                    "latency_avg": round(stats["latency_sum"] / stats["count"], 4) if stats["count"] else None,
+                    "latency_p50_le": self._percentile(stats, 50),
+                    "latency_p99_le": self._percentile(stats, 99),
+                    "latency_buckets": dict(zip([str(bound) for bound in self.buckets] + ["+Inf"], stats["buckets"])),
+                })
+            return {
+                "started_at": self.started_at,
+                "requests": requests_,
+                "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            }
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def to_prometheus(self):
+        lines = [
+            "# HELP turbo_api_requests_total Requests sent to the Turbonomic API.",
+            "# TYPE turbo_api_requests_total counter",
+        ]
+        with self._lock:
+            items = sorted(self.requests.items())
+            phases = dict(self.phases)
+        for (method, endpoint), stats in items:
+            lines.append(f'turbo_api_requests_total{{method="{method}",endpoint="{endpoint}"}} {stats["count"]}')
+        for name, key, help_text in (("errors", "errors", "Requests that failed or returned an error status."),
+                                     ("retries", "retries", "Requests retried after a retryable failure."),
+                                     ("response_bytes", "bytes", "Response bytes received.")):
+            lines.append(f"# HELP turbo_api_{name}_total {help_text}")
+            lines.append(f"# TYPE turbo_api_{name}_total counter")
+            for (method, endpoint), stats in items:
+                lines.append(f'turbo_api_{name}_total{{method="{method}",endpoint="{endpoint}"}} {stats[key]}')
+        lines.append("# HELP turbo_api_request_duration_seconds Request latency.")
+        lines.append("# TYPE turbo_api_request_duration_seconds histogram")
+        for (method, endpoint), stats in items:
+            labels = f'method="{method}",endpoint="{endpoint}"'
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + ["+Inf"], stats["buckets"]):
+                cumulative += count
+                lines.append(f'turbo_api_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"turbo_api_request_duration_seconds_sum{{{labels}}} {stats['latency_sum']:.6f}")
+            lines.append(f"turbo_api_request_duration_seconds_count{{{labels}}} {stats['count']}")
+        lines.append("# HELP turbo_run_phase_seconds Time spent in each phase of a run.")
+        lines.append("# TYPE turbo_run_phase_seconds gauge")
+        for name, seconds in sorted(phases.items()):
+            lines.append(f'turbo_run_phase_seconds{{phase="{name}"}} {seconds:.6f}')
+        return "\n".join(lines) + "\n"
+
+    def dump_prometheus(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus())
+
+    # Short plain text table for logs and the GUI
+    def summary(self):
+        data = self.to_dict()
+        lines = [f"{'method':<7} {'endpoint':<10} {'count':>7} {'errors':>7} {'retries':>7} {'bytes':>11} {'avg ms':>8} {'p99 <= ms':>10}"]
+        for row in data["requests"]:
+            avg = f"{row['latency_avg'] * 1000:.1f}" if row["latency_avg"] is not None else "-"
+            p99 = f"{row['latency_p99_le'] * 1000:.0f}" if row["latency_p99_le"] not in (None, float("inf")) else "-"
+            lines.append(f"{row['method']:<7} {row['endpoint']:<10} {row['count']:>7} {row['errors']:>7} {row['retries']:>7} {row['bytes']:>11} {avg:>8} {p99:>10}")
+        if data["phases"]:
+            lines.append("")
+            lines.extend(f"phase {name}: {seconds:.3f}s" for name, seconds in data["phases"].items())
+        return "\n".join(lines)
+
+metrics = MetricsCollector()
+
+# Bytes in a response body, without forcing a streamed body to be read
+def _response_bytes(response):
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return int(length)
+    if response.raw is None or getattr(response, "_content_consumed", False):
+        return len(response.content or b"")
+    return 0
+
+def _record_response(method, url, latency, status_code, size):
+    metrics.record_request(method, url, latency, status_code=status_code, size=size)
+    if request_logger.isEnabledFor(logging.INFO):
+        _log_request(method, url, latency, status_code=status_code, size=size)
+
+# Record a streamed response once its body has been read (or abandoned), so
+# its latency runs to the end of the body and its size counts the bytes
+# received when the server sent no Content-Length
+def finish_stream(response, received):
+    stream_metrics = getattr(response, "stream_metrics", None)
+    if stream_metrics is None:
+        return
+    method, url, start = stream_metrics
+    response.stream_metrics = None
+    length = response.headers.get("Content-Length")
+    size = int(length) if length and length.isdigit() else received
+    _record_response(method, url, time.perf_counter() - start, response.status_code, size)
 
-# Helper function to log in the user
-def login(api_url, username, password):
-    logger.info(f"Initiating login to {api_url} with provided username: {username}")
+# Read what is left of a failed response's (small) error body and close it,
+# so a streamed response gives its connection back to the pool and the error
+# body stays readable on the exception
+def _release(response):
+    if response is None:
+        return
     try:
-        response = requests.post(
-            url=f"{api_url}{LOGIN_ENDPOINT}",
+        response.content
+    except RequestException:
+        pass
+    response.close()
+
+# Logging pipeline: every record is put on a queue by the thread that logged
+# it and written out (console, log file, request log) by one listener thread,
+# so workers never wait on formatting or I/O.
+_log_listener = None
+_log_queue_handler = None
+
+# Arguments that can be formatted later on the listener thread without the
+# message changing in between; anything else is formatted when it is logged
+_DEFERRABLE_ARGS = (str, int, float, bool, type(None))
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        args = record.args if isinstance(record.args, tuple) else (record.args,)
+        if record.exc_info or not all(isinstance(arg, _DEFERRABLE_ARGS) for arg in args):
+            return super().prepare(record)
+        return record
+
+# Request log lines: one JSON object per record, with the fields passed as extra={"request": {...}}
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {"time": round(record.created, 3), "level": record.levelname, "message": record.getMessage()}
+        entry.update(getattr(record, "request", None) or {})
+        return json.dumps(entry)
+
+def _not_request_record(record):
+    return not record.name.startswith(REQUEST_LOGGER_NAME)
+
+# Start logging for an application using this module: messages at level and
+# above go to stderr (and to log_file if given); with request_log, one JSON
+# line per HTTP request goes there. Files rotate at max_bytes, keeping
+# backups old copies. Calling it again replaces the previous setup.
+def setup_logging(level=logging.INFO, log_file=None, request_log=None, max_bytes=LOG_FILE_MAX_BYTES, backups=LOG_FILE_BACKUPS):
+    global _log_listener, _log_queue_handler
+    stop_logging()
+    handlers = []
+    console = logging.StreamHandler()
+    handlers.append(console)
+    if log_file:
+        handlers.append(logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"))
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler.addFilter(_not_request_record)
+    if request_log:
+        requests_file = logging.handlers.RotatingFileHandler(request_log, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        requests_file.setFormatter(JsonLogFormatter())
+        requests_file.addFilter(logging.Filter(REQUEST_LOGGER_NAME))
+        handlers.append(requests_file)
+
+    log_queue = queue.SimpleQueue()
+    _log_queue_handler = _DeferredQueueHandler(log_queue)
+    logger.addHandler(_log_queue_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    request_logger.setLevel(logging.INFO if request_log else logging.WARNING)
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
+# Write out whatever is still queued and close the log files
+def stop_logging():
+    global _log_listener, _log_queue_handler
+    if _log_listener is None:
+        return
+    logger.removeHandler(_log_queue_handler)
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = _log_queue_handler = None
+    request_logger.setLevel(logging.WARNING)
+
+atexit.register(stop_logging)
+
+def _log_request(method, url, latency, status_code=None, error=None, size=0):
+    parts = urlsplit(url)
+    request_logger.info("%s %s %s %.1fms", method.upper(), parts.path, status_code if error is None else "error", latency * 1000, extra={"request": {
+        "method": method.upper(),
+        "host": parts.netloc,
+        "endpoint": endpoint_name(url),
+        "path": parts.path,
+        "status": status_code,
+        "latency_ms": round(latency * 1000, 2),
+        "bytes": size,
+        "error": error,
+        "thread": threading.current_thread().name,
+    }})
+
+# Shared HTTP client for one Turbonomic instance. Owns a pooled keep-alive
+# requests.Session so every API call reuses already open TCP/TLS connections,
+# and carries the auth cookie as a default header once logged in.
+# It also remembers the login so an expired session can be renewed in place.
+class TurboClient:
+    def __init__(self, api_url, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                 keep_alive=KEEP_ALIVE, headers=None, verify=False,
+                 initial_concurrency=MAX_WORKERS, max_concurrency=MAX_CONCURRENCY, retry_policy=DEFAULT_RETRY_POLICY):
+        self.api_url = api_url
+        self.token = None
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+
+        # Shared by every request to this server, whichever bulk operation sends it
+        self.limiter = AdaptiveLimiter(initial=initial_concurrency, maximum=min(max_concurrency, pool_maxsize))
+        self.retry_policy = retry_policy
+
+        # Auth session state
+        self._auth_lock = threading.Lock()
+        self._credentials = None  # (username, password) of the last successful login
+        self._token_expires_at = None  # absolute expiry from the cookie, if the server sent one
+        self._last_used = 0.0  # time of the last response that was accepted with the token
+        self._retired_tokens = set()  # tokens replaced by a re-login, never adopted again
+        self.reauthentications = 0
+
+        self.session = requests.Session()
+        self.session.verify = verify
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        # pool_block keeps us at pool_maxsize connections per host instead of
+        # opening (and then throwing away) extra ones under load
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def set_token(self, token):
+        if self.token and token != self.token:
+            self._retired_tokens.add(self.token)
+        self.token = token
+        self._last_used = time.time()
+        if token:
+            self.session.headers["cookie"] = token
+        else:
+            self.session.headers.pop("cookie", None)
+
+    # Tokens callers may still hold after a re-login replaced them
+    def is_retired(self, token):
+        return token in self._retired_tokens
+
+    def remember_login(self, username, password, token, expires_at=None):
+        self._credentials = (username, password)
+        self._token_expires_at = expires_at
+        self.set_token(token)
+
+    def can_reauthenticate(self):
+        return self._credentials is not None
+
+    def token_expired(self):
+        if not self.token:
+            return True
+        now = time.time()
+        if self._token_expires_at and now >= self._token_expires_at:
+            return True
+        return now - self._last_used > SESSION_IDLE_TIMEOUT
+
+    # Log in again with the remembered credentials. Many threads can see the
+    # same expiry at once; only the first one logs in, the others find the
+    # token already replaced and simply replay with the new one.
+    def reauthenticate(self, stale_token):
+        with self._auth_lock:
+            if self.token and self.token != stale_token:
+                return True
+            if not self._credentials:
+                return False
+            logger.info("Session for %s expired, logging in again.", self.api_url)
+            username, password = self._credentials
+            renewed = login(self.api_url, username, password, force=True) is not None
+            if renewed:
+                self.reauthentications += 1
+            return renewed
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self._requests_sent += 1
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method=method, url=url, **kwargs)
+        except RequestException as e:
+            latency = time.perf_counter() - start
+            metrics.record_request(method, url, latency, error=True)
+            if request_logger.isEnabledFor(logging.INFO):
+                _log_request(method, url, latency, error=type(e).__name__)
+            raise
+        if kwargs.get("stream") and response.status_code < 400:
+            # The body hasn't been read yet: recorded by finish_stream once it has
+            response.stream_metrics = (method, url, start)
+        else:
+            _record_response(method, url, time.perf_counter() - start, response.status_code, _response_bytes(response))
+        if response.status_code not in AUTH_FAILURE_CODES:
+            self._last_used = time.time()
+        return response
+
+    # Number of requests sent vs. connections opened to serve them
+    def connection_stats(self):
+        pools = self.adapter.poolmanager.pools
+        opened = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+        with self._lock:
+            sent = self._requests_sent
+        reused = max(sent - opened, 0)
+        return {
+            "requests": sent,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / sent, 3) if sent else 0.0,
+        }
+
+    def close(self):
+        self.session.close()
+
+# One shared client per Turbonomic URL, created on first use
+_clients = {}
+_clients_lock = threading.Lock()
+_client_options = {}
+
+# Change the settings (pool_connections, pool_maxsize, keep_alive, headers, verify,
+# initial_concurrency, max_concurrency, retry_policy) used for clients created from now on
+def configure_clients(**options):
+    _client_options.update(options)
+
+def get_client(api_url):
+    with _clients_lock:
+        client = _clients.get(api_url)
+        if client is None:
+            client = TurboClient(api_url, **_client_options)
+            _clients[api_url] = client
+        return client
+
+# Create the client for one api_url with its own settings (for example a lower
+# max_concurrency for a smaller instance), replacing any existing client
+def configure_client(api_url, **options):
+    client = TurboClient(api_url, **{**_client_options, **options})
+    with _clients_lock:
+        previous = _clients.get(api_url)
+        _clients[api_url] = client
+    if previous is not None:
+        previous.close()
+    return client
+
+def close_clients():
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+# Get the shared client for api_url, adopting a token handed in by the caller
+# (unless a re-login has already replaced that token)
+def _resolve_client(api_url, token=""):
+    client = get_client(api_url)
+    if token and token != client.token and not client.is_retired(token):
+        client.set_token(token)
+    return client
+
+# Expiry of the auth cookie, if the server gave one
+def _cookie_expiry(response, name):
+    for cookie in response.cookies:
+        if cookie.name == name and cookie.expires:
+            return cookie.expires
+    return None
+
+# Helper function to log in the user. A still-valid session for the same
+# user is reused unless force is set.
+def login(api_url, username, password, force=False):
+    client = get_client(api_url)
+    if not force and client.token and client._credentials == (username, password) and not client.token_expired():
+        logger.info("Reusing the existing session for %s on %s", username, api_url)
+        return client.token
+
+    logger.info("Initiating login to %s with provided username: %s", api_url, username)
+    try:
+        response = client.request(
+            "POST",
+            f"{api_url}{LOGIN_ENDPOINT}",
             data={"username": username, "password": password},
-            timeout=TIMEOUT,
-            verify=False
+            timeout=TIMEOUT
         )
 
         response.raise_for_status()  # Will raise an error for bad status codes (4xx, 5xx)
@@ -37,78 +661,408 @@ def login(api_url, username, password):
         auth_token = response.headers.get('Set-Cookie').split(";")[0]
         if auth_token:
             logger.info("Login successful. Authentication token received.")
+            client.remember_login(username, password, auth_token, _cookie_expiry(response, auth_token.split("=")[0]))
             return auth_token
         else:
             logger.error("Login failed: Authentication token not found in response headers.")
             return None
 
     except (HTTPError, Timeout, RequestException) as e:
-        logger.error(f"Login failed: {e}")
+        logger.error("Login failed: %s", e)
         return None
 
-# Helper function to handle requests with retries
-def request_with_retries(method, url, params=None, data=None, headers=None, retries=RETRIES, timeout=TIMEOUT):
+# Helper function to handle requests with retries. Retryable failures (see
+# RetryPolicy) are retried with backoff, honouring Retry-After; every attempt
+# goes through the client's adaptive concurrency limiter.
+def request_with_retries(method, url, params=None, data=None, headers=None, retries=None, timeout=TIMEOUT, client=None, policy=None, stream=False):
+    # Callers outside this module may not hand in a client; every endpoint lives under /api/
+    if client is None:
+        client = get_client(url.split("/api/", 1)[0])
+    policy = policy or client.retry_policy
+    retries = retries or policy.attempts
+    # Renew the session up front rather than wait for it to be rejected. The
+    # token is read before the check so a renewal another thread finishes in
+    # between isn't mistaken for the stale token and repeated.
+    stale_token = client.token
+    if client.can_reauthenticate() and client.token_expired():
+        client.reauthenticate(stale_token)
+
     attempt = 0
+    reauthenticated = False
     while attempt < retries:
+        response = None
+        client.limiter.acquire()
+        outcome = "error"
         try:
-            logger.info(f"Attempting {method.upper()} request to {url} with params: {params} and data.")
-            response = requests.request(
-                method=method,
-                url=url,
+            logger.info("Attempting %s request to %s with params: %s and data.", method.upper(), url, params)
+            sent_token = client.token
+            response = client.request(
+                method,
+                url,
                 params=params,
                 json=data, 
                 headers=headers,
                 timeout=timeout,
-                verify=False
+                stream=stream
             )
+            if response.status_code in THROTTLE_STATUSES:
+                outcome = "throttled"
+            elif response.status_code < 400:
+                outcome = "success"
+        except RequestException as e:
+            error = e
+        else:
+            error = None
+        finally:
+            client.limiter.release(outcome)
+
+        # Session expired mid-run: log in again (once) and replay the request
+        if response is not None and response.status_code in AUTH_FAILURE_CODES and not reauthenticated and client.can_reauthenticate():
+            reauthenticated = True
+            response.close()
+            if client.reauthenticate(sent_token):
+                logger.info("Replaying %s request to %s with the renewed session.", method.upper(), url)
+                continue
+
+        try:
+            if error is not None:
+                raise error
             response.raise_for_status()  # Raise an error for bad status codes
             return response
         except (HTTPError, Timeout, RequestException) as e:
             attempt += 1
-            logger.error(f"Attempt {attempt}/{retries} failed: {e}")
+            logger.error("Attempt %s/%s failed: %s", attempt, retries, e)
+            if not policy.is_retryable(method, response=response if error is None else None, error=error):
+                logger.error("Not retrying %s %s: the error is not retryable.", method.upper(), url)
+                _release(response)
+                raise
             if attempt >= retries:
-                logger.error(f"All {retries} attempts failed. Raising exception.")
+                logger.error("All %s attempts failed. Raising exception.", retries)
+                _release(response)
                 raise
-            else:
-                logger.info("Retrying...")
+            delay = policy.delay(attempt, response=response if error is None else None)
+            if response is not None:
+                response.close()
+            logger.info("Retrying in %.2fs...", delay)
+            metrics.record_retry(method, url)
+            time.sleep(delay)
+
+# Decode a JSON array response one element at a time while the body is still
+# downloading, so only the element being decoded (not the whole body and the
+# whole object graph) is held in memory. With fields, each element is cut down
+# to just those keys as soon as it is decoded. A body that isn't an array is
+# decoded whole; a list is yielded element by element, anything else as is.
+# A malformed or truncated array raises ValueError (json.JSONDecodeError for
+# bad syntax). The response is closed, and its size and latency recorded,
+# when the generator finishes or is closed early.
+_json_decoder = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+
+def iter_json_array(response, fields=None, chunk_size=JSON_CHUNK_SIZE):
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+    received = [0]
+
+    def read_chunks():
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            received[0] += len(chunk)
+            yield chunk
+
+    chunks = read_chunks()
+    buffer = ""
+    try:
+        for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            if buffer.lstrip(_JSON_WHITESPACE + "\ufeff"):
+                break
+        buffer = buffer.lstrip(_JSON_WHITESPACE + "\ufeff")
+        if not buffer.startswith("["):
+            body = buffer + "".join(decoder.decode(chunk) for chunk in chunks) + decoder.decode(b"", final=True)
+            if not body.strip(_JSON_WHITESPACE):
+                return
+            body = json.loads(body)
+            for item in body if isinstance(body, list) else [body]:
+                yield _project(item, fields)
+            return
+
+        pos = 1
+        eof = False
+        expect = "first"  # first element or "]", then "value" after a comma, "separator" after a value
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                char = buffer[pos]
+                if expect == "separator":
+                    if char == "]":
+                        break
+                    if char != ",":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                    pos += 1
+                    expect = "value"
+                    continue
+                if char == "]" and expect == "first":
+                    break
+                if char in ",]":
+                    raise json.JSONDecodeError("Expecting value", buffer, pos)
+                try:
+                    item, end = _json_decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A number (or true/false/null) is only known to be complete
+                    # once a delimiter follows it: "12." may still become "12.5"
+                    after = end
+                    while after < len(buffer) and buffer[after] in _JSON_WHITESPACE:
+                        after += 1
+                    if eof or isinstance(item, (dict, list, str)) or (after < len(buffer) and buffer[after] in ",]"):
+                        pos = end
+                        expect = "separator"
+                        yield _project(item, fields)
+                        continue
+            if eof:
+                raise ValueError("The JSON array in the response body is incomplete.")
+            chunk = next(chunks, None)
+            eof = chunk is None
+            buffer = buffer[pos:] + decoder.decode(chunk or b"", final=eof)
+            pos = 0
+
+        # Nothing but whitespace may follow the closing bracket
+        rest = buffer[pos + 1:] + "".join(decoder.decode(chunk) for chunk in chunks) + decoder.decode(b"", final=True)
+        if rest.strip(_JSON_WHITESPACE):
+            raise json.JSONDecodeError("Extra data", rest, len(rest) - len(rest.lstrip(_JSON_WHITESPACE)))
+    finally:
+        response.close()
+        finish_stream(response, received[0])
+
+def _project(item, fields):
+    if not fields or not isinstance(item, dict):
+        return item
+    return {name: item[name] for name in fields if name in item}
+
+# GET one page of a cursor-paginated endpoint with the body left unread.
+# Returns (response, next_cursor); next_cursor is None on the last page or
+# when the endpoint doesn't paginate.
+def _request_page(client, url, params=None, cursor=None, limit=PAGE_SIZE):
+    page_params = dict(params or {})
+    if limit:
+        page_params["limit"] = limit
+    if cursor:
+        page_params["cursor"] = cursor
+    response = request_with_retries("GET", url, params=page_params, client=client, stream=True)
+    return response, response.headers.get("X-Next-Cursor") or None
+
+# Fetch one page of a cursor-paginated GET. Returns (items, next_cursor).
+def _get_page(client, url, params=None, cursor=None, limit=PAGE_SIZE, fields=None):
+    response, next_cursor = _request_page(client, url, params=params, cursor=cursor, limit=limit)
+    return list(iter_json_array(response, fields)), next_cursor
+
+# Yield every element of a cursor-paginated GET, page after page, decoding
+# each page as it downloads
+def _iter_items(client, url, params=None, limit=PAGE_SIZE, fields=None):
+    cursor = None
+    seen = set()
+    while True:
+        response, cursor = _request_page(client, url, params=params, cursor=cursor, limit=limit)
+        yield from iter_json_array(response, fields)
+        if not cursor or cursor in seen:
+            return
+        seen.add(cursor)
+
+# Yield every page of a cursor-paginated GET, following X-Next-Cursor
+def _iter_pages(client, url, params=None, limit=PAGE_SIZE, fields=None):
+    cursor = None
+    seen = set()
+    while True:
+        items, cursor = _get_page(client, url, params=params, cursor=cursor, limit=limit, fields=fields)
+        yield items
+        if not cursor or cursor in seen:
+            return
+        seen.add(cursor)
+
+# Function to perform GET request on /targets, one page at a time.
+# Yields lists of targets as each page arrives so callers can start on the
+# first page right away; raises if a page can't be fetched.
+# With fields, each target is cut down to just those keys as it is decoded.
+def iter_target_pages(api_url, token="", params={}, page_size=PAGE_SIZE, fields=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for fetching targets.")
+        return
+
+    logger.info("Fetching targets from %s%s in pages of %s.", api_url, TARGETS_ENDPOINT, page_size)
+    yield from _iter_pages(client, f"{api_url}{TARGETS_ENDPOINT}", params=params, limit=page_size, fields=fields)
+
+# Keys of a /targets element that Target reads; everything else can be dropped while decoding
+TARGET_JSON_FIELDS = ("uuid", "displayName", "category", "type", "status", "lastEditTime", "inputFields")
+
+# Keys kept from /search results for VMs and groups
+SEARCH_FIELDS = ("uuid", "displayName", "className")
+
+# Input field name -> Target attribute, for the fields the tool works with
+TARGET_INPUT_FIELDS = {
+    "targetId": "target_id",
+    "username": "username",
+    "password": "password",
+    "port": "port",
+    "databaseID": "database_id",
+    "fullValidation": "full_validation",
+    "targetEntities": "scope",
+}
+
+# One target from /api/v3/targets, with its inputFields parsed once into
+# attributes. __slots__ keeps tens of thousands of these small; input fields
+# the tool doesn't use are dropped.
+class Target:
+    __slots__ = ("uuid", "display_name", "category", "type", "status", "last_edit_time", *TARGET_INPUT_FIELDS.values())
+
+    def __init__(self, uuid, display_name=None, category=None, type=None, status=None, last_edit_time=None, **fields):
+        self.uuid = uuid
+        self.display_name = display_name
+        self.category = category
+        self.type = type
+        self.status = status
+        self.last_edit_time = last_edit_time
+        for attribute in TARGET_INPUT_FIELDS.values():
+            setattr(self, attribute, fields.get(attribute))
+
+    @classmethod
+    def from_json(cls, target):
+        fields = {}
+        for field in target.get("inputFields", ()):
+            attribute = TARGET_INPUT_FIELDS.get(field.get("name"))
+            if attribute:
+                fields[attribute] = field.get("value")
+        return cls(target["uuid"], target.get("displayName"), target.get("category"), target.get("type"),
+                   target.get("status"), target.get("lastEditTime"), **fields)
+
+    # From a row in the order of row() (e.g. the GUI's SQLite inventory)
+    @classmethod
+    def from_row(cls, row):
+        uuid, display_name, username, port, database_id, status, last_edit_time, scope = row
+        return cls(uuid, display_name, status=status, last_edit_time=last_edit_time, username=username,
+                   port=port, database_id=database_id, scope=scope)
+
+    # The targetId the tool names targets by, falling back to the display name
+    @property
+    def key(self):
+        return self.target_id or self.display_name
+
+    # Value of an input field by its API name (username, databaseID, ...)
+    def field(self, name):
+        attribute = TARGET_INPUT_FIELDS.get(name)
+        return getattr(self, attribute) if attribute else None
+
+    # (uuid, displayName, username, port, databaseID, status, lastEditTime, scope) as strings
+    def row(self):
+        values = (self.uuid, self.display_name, self.username, self.port, self.database_id,
+                  self.status, self.last_edit_time, self.scope)
+        return tuple(None if value is None else str(value) for value in values)
+
+    def __repr__(self):
+        return f"Target({self.uuid!r}, {self.key!r}, status={self.status!r})"
+
+# In-memory target list indexed by UUID and by targetId, shared between the
+# bulk operations and the GUI instead of each keeping raw JSON
+class TargetInventory:
+    def __init__(self, targets=()):
+        self._lock = threading.Lock()
+        self.by_uuid = {}
+        self.by_target_id = {}
+        self.update(targets)
+
+    def add(self, target):
+        with self._lock:
+            self._add(target)
+
+    def _add(self, target):
+        previous = self.by_uuid.get(target.uuid)
+        if previous is not None and self.by_target_id.get(previous.key) is previous:
+            del self.by_target_id[previous.key]
+        self.by_uuid[target.uuid] = target
+        if target.key:
+            self.by_target_id[target.key] = target
+
+    def update(self, targets):
+        with self._lock:
+            for target in targets:
+                self._add(target)
+
+    def remove(self, uuid):
+        with self._lock:
+            target = self.by_uuid.pop(uuid, None)
+            if target is not None and self.by_target_id.get(target.key) is target:
+                del self.by_target_id[target.key]
+            return target
+
+    def clear(self):
+        with self._lock:
+            self.by_uuid.clear()
+            self.by_target_id.clear()
+
+    def get(self, uuid):
+        return self.by_uuid.get(uuid)
+
+    def find(self, target_id):
+        return self.by_target_id.get(target_id)
+
+    def __contains__(self, uuid):
+        return uuid in self.by_uuid
+
+    def __len__(self):
+        return len(self.by_uuid)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self.by_uuid.values()))
+
+# Load every target matching params into an inventory (a new one unless given)
+def fetch_inventory(api_url, token="", params={}, page_size=PAGE_SIZE, inventory=None):
+    inventory = TargetInventory() if inventory is None else inventory
+    for page in iter_target_pages(api_url, token, params=params, page_size=page_size, fields=TARGET_JSON_FIELDS):
+        inventory.update(Target.from_json(target) for target in page)
+    return inventory
 
 # Function to perform GET request on /targets
 def get_targets(api_url, token="", params={}):
-    if not token:
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for fetching targets.")
         return None
     
     try:
-        logger.info(f"Fetching targets from {api_url}{TARGETS_ENDPOINT} with token.")
-        response = request_with_retries("GET", f"{api_url}{TARGETS_ENDPOINT}", params=params, headers={"cookie": token})
-        return response.json()  # Assuming response is in JSON format
+        targets = []
+        for page in iter_target_pages(api_url, token, params=params):
+            targets.extend(page)
+        return targets
     except Exception as e:
-        logger.error(f"Failed to get targets: {e}")
+        logger.error("Failed to get targets: %s", e)
         return None
 
 def delete_target(api_url, token, target_uuid):
-    if not token:
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for deleting targets.")
         return None
     if not target_uuid:
         logger.error("Target UUID is required.")
         return None
     try:
-        logger.info(f"Attempting to delete target with UUID: {target_uuid}...")
+        logger.info("Attempting to delete target with UUID: %s...", target_uuid)
         url = f"{api_url}{TARGETS_ENDPOINT}/{target_uuid}"
         
         # Sending the PUT request to update the target
-        response = request_with_retries("DELETE", url, headers={"cookie": token})
+        response = request_with_retries("DELETE", url, client=client)
 
         # Check if the response was successful
         if response.status_code == 200:
-            logger.info(f"Target {target_uuid} successfully deleted.")
+            logger.info("Target %s successfully deleted.", target_uuid)
             return response.json()
         else:
-            logger.error(f"Failed to update target {target_uuid}. Status code: {response.status_code}.")
+            logger.error("Failed to update target %s. Status code: %s.", target_uuid, response.status_code)
             return None
     except Exception as e:
-        logger.error(f"Error occurred while updating target {target_uuid}: {e}")
+        logger.error("Error occurred while updating target %s: %s", target_uuid, e)
         return None
 
 # def delete_scope(api_url, token, scope_uuid):
@@ -135,187 +1089,884 @@ def delete_target(api_url, token, target_uuid):
 #         logger.error(f"Error occurred while deleting scope {scope_uuid}: {e}")
 #         return None
 
-def delete_oracle_targets(api_url, token="", params={}):
-    if not token:
+# Spaces calls out so that no more than `rate` of them start per second,
+# across all threads sharing the limiter. A rate of None or 0 means no limit.
+class RateLimiter:
+    def __init__(self, rate=None):
+        self.rate = rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+# DELETE a single target and describe what happened
+def _delete_one(client, api_url, uuid, limiter, cancel_event=None, journal=None):
+    result = {"status": "failed", "status_code": None, "latency": None, "error": None}
+    if cancel_event and cancel_event.is_set():
+        result["status"] = "cancelled"
+        return uuid, result
+    if journal and journal.completed("delete", uuid):
+        journal.skip()
+        result.update(status="deleted", resumed=True)
+        return uuid, result
+
+    limiter.acquire()
+    start = time.perf_counter()
+    try:
+        response = request_with_retries("DELETE", f"{api_url}{TARGETS_ENDPOINT}/{uuid}", client=client)
+        result["status_code"] = response.status_code
+        if response.ok:
+            result["status"] = "deleted"
+            logger.info("Successfully deleted target %s", uuid)
+        else:
+            logger.error("Failed to delete target %s, status code: %s", uuid, response.status_code)
+    except Exception as e:
+        response = getattr(e, "response", None)
+        if response is not None:
+            result["status_code"] = response.status_code
+        result["error"] = str(e)
+        logger.error("Error deleting target %s: %s", uuid, e)
+    result["latency"] = round(time.perf_counter() - start, 3)
+    if journal:
+        journal.record("delete", uuid, result["status"], status_code=result["status_code"], error=result["error"])
+    return uuid, result
+
+# Delete many targets at once: up to max_workers DELETEs in flight and at most
+# `rate` started per second. Returns {uuid: {status deleted/failed/cancelled,
+# status_code, latency, error}} in the order the UUIDs were given.
+# on_result(uuid, result) is called as each one finishes. With a journal,
+# UUIDs it shows as deleted are not sent again.
+def bulk_delete_targets(api_url, token, target_uuids, max_workers=MAX_WORKERS, rate=None, on_result=None, cancel_event=None, journal=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for deleting targets.")
+        return None
+
+    uuids = list(dict.fromkeys(uuid for uuid in target_uuids if uuid))
+    logger.info("Deleting %s targets with up to %s requests in flight...", len(uuids), max_workers)
+    limiter = RateLimiter(rate)
+    finished = {}
+    for uuid, result in _bounded_imap(lambda uuid: _delete_one(client, api_url, uuid, limiter, cancel_event, journal), uuids, max_workers=max_workers):
+        finished[uuid] = result
+        if on_result:
+            on_result(uuid, result)
+
+    report = {uuid: finished[uuid] for uuid in uuids}
+    deleted = sum(1 for result in report.values() if result["status"] == "deleted")
+    logger.info("Bulk delete finished: %s deleted, %s not deleted.", deleted, len(report) - deleted)
+    return report
+
+# Delete every CRITICAL Oracle target, page by page, using bulk_delete_targets.
+# Returns the combined per-UUID report. on_result(uuid, result) is called after
+# every delete attempt; setting cancel_event stops the run before the next
+# delete is sent.
+def delete_oracle_targets(api_url, token="", params={}, page_size=PAGE_SIZE, max_workers=MAX_WORKERS, rate=None, on_result=None, cancel_event=None, journal=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for deleting Oracle targets.")
-        return
+        return None
 
+    url = f"{api_url}{TARGETS_ENDPOINT}"
+    query = {"target_type": "ORACLE", "health_state": "CRITICAL"}
+    report = {}
+    cursor = None
     try:
-        logger.info(f"Deleting malfunctioning Oracle targets from {api_url}{TARGETS_ENDPOINT}")
-        targets = request_with_retries("GET", f"{api_url}{TARGETS_ENDPOINT}", params={"target_type": "ORACLE", "health_state": "CRITICAL"}, headers={"cookie": token})
-        results = targets.json()
-        for result in results:
-            uuid = result.get("uuid")
+        logger.info("Deleting malfunctioning Oracle targets from %s%s", api_url, TARGETS_ENDPOINT)
+        while not (cancel_event and cancel_event.is_set()):
+            results, next_cursor = _get_page(client, url, params=query, cursor=cursor, limit=page_size, fields=("uuid",))
+            fresh = [result.get("uuid") for result in results if result.get("uuid") not in report]
+            if not fresh:
+                # Everything on this page was already tried (and failed); move on
+                if not next_cursor:
+                    break
+                cursor = next_cursor
+                continue
+
+            # delete groups associated with the targets too.
             # scope_uuid = next((field["value"] for field in result["inputFields"] if field["name"] == "targetEntities"), None)
-            try:
-                response = request_with_retries("DELETE", f"{api_url}{TARGETS_ENDPOINT}/{uuid}", headers={"cookie": token})
-                # delete groups associated with the targets too.
-                # response2 = request_with_retries("DELETE", f"{api_url}{GROUPS_ENDPOINT}/{scope_uuid}", headers={"cookie": token})
-                if response.status_code == 500: 
-                    logger.error(f"Server error (500) while deleting target {uuid}. Skipping this target.")
-                    continue  
-                if not response.ok:
-                    logger.error(f"Failed to delete target {uuid}, status code: {response.status_code}")
-                    continue
-                logger.info(f"Successfully deleted target {uuid}")
-            except Exception as e:
-                logger.error(f"Error deleting target {uuid}: {e}")
-                continue  # Continue to the next target if an exception occurs
+            page_report = bulk_delete_targets(api_url, token, fresh, max_workers=max_workers, rate=rate, on_result=on_result, cancel_event=cancel_event, journal=journal)
+            report.update(page_report)
+
+            # Deleting shifts every later record forward, so start again from the first page
+            cursor = None
 
     except Exception as e:
-        logger.error(f"Failed to retrieve or delete Oracle targets: {e}")
-    return None
+        logger.error("Failed to retrieve or delete Oracle targets: %s", e)
+    return report
 
-# Function to perform POST request on /targets to create new Oracle targets
-def create_oracle_targets(api_url, token="", params=[]):
-    if not token:
+# Bounded, TTL-evicting memo for name -> UUID lookups. Concurrent lookups of
+# the same key share one computation instead of each hitting the API.
+# Failed lookups (None or an exception) are not cached.
+class ResolutionCache:
+    def __init__(self, maxsize=RESOLUTION_CACHE_SIZE, ttl=RESOLUTION_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._pending = {}  # key -> Future of the lookup currently running
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0  # lookups that waited on an identical lookup already in flight
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.evictions += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                self.misses += 1
+                future = Future()
+                self._pending[key] = future
+            else:
+                self.shared += 1
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            if value is not None:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        future.set_result(value)
+        return value
+
+    # Cached value for key without computing it or counting a lookup
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[1] if entry is not None and entry[0] > time.monotonic() else None
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.shared
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_ratio": round((self.hits + self.shared) / lookups, 3) if lookups else 0.0,
+            }
+
+# Server name -> VM UUID and server name -> group, keyed by (api_url, server_name)
+_vm_cache = ResolutionCache()
+_group_cache = ResolutionCache()
+
+def resolution_cache_stats():
+    return {"vm": _vm_cache.stats(), "group": _group_cache.stats()}
+
+def clear_resolution_caches():
+    _vm_cache.clear()
+    _group_cache.clear()
+
+# Prefetched name -> UUID index of every VM and every "On-Prem - Oracle - *"
+# group, so per-row lookups can be answered locally. A miss (or an ambiguous
+# VM name) falls back to the live /search lookup.
+class ResolutionIndex:
+    def __init__(self):
+        self.vms = {}  # displayName -> uuid
+        self.groups = {}  # displayName -> group
+        self._ambiguous_vms = set()
+        self.hits = 0
+        self.misses = 0
+
+    def add_vm(self, name, uuid):
+        if name in self.vms and self.vms[name] != uuid:
+            self._ambiguous_vms.add(name)
+        self.vms[name] = uuid
+
+    def add_group(self, group):
+        self.groups[group["displayName"]] = group
+
+    def vm_uuid(self, vm_name):
+        uuid = None if vm_name in self._ambiguous_vms else self.vms.get(vm_name)
+        self._count(uuid)
+        return uuid
+
+    def group(self, server_name):
+        group = self.groups.get(oracle_group_name(server_name))
+        self._count(group)
+        return group
+
+    def _count(self, found):
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self):
+        return {"vms": len(self.vms), "groups": len(self.groups), "hits": self.hits, "misses": self.misses}
+
+_indexes = {}  # api_url -> ResolutionIndex
+
+# Page through all VirtualMachines and all Oracle groups once and keep the
+# index for api_url; later get_vm_uuid/create_group calls consult it first.
+def prefetch_resolution_index(api_url, token="", page_size=PAGE_SIZE):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for prefetching VMs and groups.")
+        return None
+
+    index = ResolutionIndex()
+    logger.info("Prefetching VirtualMachines and Oracle groups from %s%s...", api_url, SEARCH_ENDPOINT)
+    for vm in _iter_items(client, f"{api_url}{SEARCH_ENDPOINT}", params={"types": ["VirtualMachine"]}, limit=page_size, fields=SEARCH_FIELDS):
+        index.add_vm(vm.get("displayName"), vm.get("uuid"))
+    for group in _iter_items(client, f"{api_url}{SEARCH_ENDPOINT}", params={"q": oracle_group_name(""), "types": ["Group"]}, limit=page_size, fields=SEARCH_FIELDS):
+        index.add_group(group)
+    logger.info("Prefetched %s VMs and %s Oracle groups.", len(index.vms), len(index.groups))
+
+    _indexes[api_url] = index
+    return index
+
+def drop_resolution_index(api_url):
+    _indexes.pop(api_url, None)
+
+# Run fn over items on a pool of worker threads, keeping at most max_workers
+# calls in flight, and yield the results in completion order. Items are pulled
+# lazily so a generator input is never read far ahead of the workers.
+def _bounded_imap(fn, items, max_workers=MAX_WORKERS):
+    max_workers = max(1, int(max_workers))
+    items = iter(items)
+    in_flight = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for item in items:
+            in_flight.add(executor.submit(fn, item))
+            if len(in_flight) >= max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            else:
+                done = {future for future in in_flight if future.done()}
+                in_flight -= done
+            for future in done:
+                yield future.result()
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # Reached when the consumer stops early: drop whatever has not started yet
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+# Pull the value of one named input field out of a target payload
+def _input_field(payload, name):
+    return next((field["value"] for field in payload.get("inputFields", []) if field["name"] == name), None)
+
+# POST a single target payload and wait for the server's real answer
+def _create_oracle_target(client, api_url, payload, timeout=CREATE_TIMEOUT, journal=None):
+    result = {
+        "targetId": _input_field(payload, "targetId"),
+        "status": "failed",
+        "status_code": None,
+        "uuid": None,
+        "latency": None,
+        "error": None,
+    }
+    if journal:
+        journal.record("create", result["targetId"], "submitted")
+    start = time.perf_counter()
+    try:
+        response = request_with_retries(method="POST", url=f"{api_url}{TARGETS_ENDPOINT}", data=payload, client=client, timeout=timeout)
+        result["status_code"] = response.status_code
+        if response.ok:
+            result["status"] = "created"
+            try:
+                result["uuid"] = response.json().get("uuid")
+            except ValueError:
+                pass
+            logger.info("Oracle target %s created", result['targetId'])
+        else:
+            logger.error("Failed to create Oracle target %s. Status code: %s.", result['targetId'], response.status_code)
+    except Exception as e:
+        response = getattr(e, "response", None)
+        if response is not None:
+            result["status_code"] = response.status_code
+        result["error"] = str(e)
+        logger.error("Failed to create Oracle target %s: %s", result['targetId'], e)
+    result["latency"] = round(time.perf_counter() - start, 3)
+    if journal:
+        # Without a response (timeout, dropped connection) the POST may still
+        # have created the target: leave it to be looked up on resume
+        stage = "unanswered" if result["status"] == "failed" and result["status_code"] is None else result["status"]
+        journal.record("create", result["targetId"], stage, uuid=result["uuid"], status_code=result["status_code"], error=result["error"])
+    return result
+
+# Function to perform POST request on /targets to create new Oracle targets.
+# Up to max_workers creates are in flight at once; returns one result dict per
+# payload (targetId, status created/failed, status_code, uuid, latency, error)
+# in the same order as params.
+def create_oracle_targets(api_url, token="", params=[], max_workers=MAX_WORKERS, timeout=CREATE_TIMEOUT):
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for creating Oracle targets.")
         return None
     if not params:
         logger.error("No payload provided to create Oracle targets.")
         return None
-    
-    for cf in params:
-        logger.info(f"Attempting to create an Oracle target...")
-        try:
-            # Sending the request - "fire and forget"
-            request_with_retries(method="POST", url=f"{api_url}{TARGETS_ENDPOINT}", data=cf, headers={"cookie": token}, timeout=1)
-            logger.info(f"Oracle target creation request sent")
-        except Exception as e:
-            logger.info(f"Broke out of wait for request completion. Expected output")
-
-# Example function to test all request types
-def run_targets_script(api_url, username, password, filepath):
+
+    logger.info("Creating %s Oracle targets with up to %s requests in flight...", len(params), max_workers)
+    indexed = list(enumerate(params))
+    results = [None] * len(indexed)
+
+    def create(item):
+        index, payload = item
+        return index, _create_oracle_target(client, api_url, payload, timeout=timeout)
+
+    for index, result in _bounded_imap(create, indexed, max_workers=max_workers):
+        results[index] = result
+
+    created = sum(1 for result in results if result["status"] == "created")
+    logger.info("Oracle target creation finished: %s created, %s failed.", created, len(results) - created)
+    return results
+
+# Append-only record (JSON lines) of what a batch run has done, row by row, so
+# a run that dies halfway can be started again with the same journal and only
+# do the remaining work. Records hold stage outcomes and UUIDs, never
+# passwords or other input field values:
+#   {"op": "resolve", "key": server, "stage": "resolved", "group_uuid": ..., "vm_uuid": ...}
+#   {"op": "create", "key": targetId, "stage": "submitted" | "created" | "failed" | "unanswered", "uuid": ...}
+#   {"op": "update", "key": uuid, "stage": "updated" | "failed" | "rediscovered" | "rediscover_failed"}
+#   {"op": "delete", "key": uuid, "stage": "deleted" | "failed"}
+# Every record is flushed as it is written (fsync=True also syncs it to disk).
+# A half-written last line from a crash is ignored on the next load.
+class JobJournal:
+    # Stages after which the work for a key is finished
+    DONE_STAGES = {"create": "created", "update": "updated", "delete": "deleted"}
+
+    def __init__(self, path, api_url=None, fsync=False):
+        self.path = path
+        self.api_url = api_url
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._stages = {}  # (op, key) -> {stage: record}
+        self._latest = {}  # (op, key) -> stage of the last record
+        self._groups = {}  # server name -> group UUID
+        self.resumed = False
+        self.skipped = 0
+        self._load()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._write({"op": "open", "api_url": api_url})
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash
+                if record.get("op") == "open":
+                    if self.api_url and record.get("api_url") and record["api_url"] != self.api_url:
+                        raise ValueError(f"Journal {self.path} belongs to {record['api_url']}, not {self.api_url}.")
+                    continue
+                self._apply(record)
+                self.resumed = True
+
+    def _apply(self, record):
+        self._stages.setdefault((record["op"], record["key"]), {})[record["stage"]] = record
+        self._latest[(record["op"], record["key"])] = record["stage"]
+        if record["op"] == "resolve" and record.get("group_uuid"):
+            self._groups[record["key"]] = record["group_uuid"]
+
+    def _write(self, record):
+        record["time"] = round(time.time(), 3)
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def record(self, op, key, stage, **data):
+        record = {"op": op, "key": key, "stage": stage, **data}
+        self._write(record)
+        with self._lock:
+            self._apply(record)
+
+    # Count work left out because an earlier run finished it
+    def skip(self, count=1):
+        with self._lock:
+            self.skipped += count
+
+    # The record of a finished stage for key, or None
+    def stage(self, op, key, stage):
+        with self._lock:
+            return self._stages.get((op, key), {}).get(stage)
+
+    # The record showing the work for key is done, or None
+    def completed(self, op, key):
+        return self.stage(op, key, self.DONE_STAGES[op])
+
+    def group(self, server_name):
+        with self._lock:
+            group_uuid = self._groups.get(server_name)
+        return {"uuid": group_uuid} if group_uuid else None
+
+    # Creates sent but never answered (no response, or none recorded before a
+    # crash); the target may or may not exist
+    def in_doubt(self):
+        with self._lock:
+            return [key for (op, key), stage in self._latest.items()
+                    if op == "create" and stage in ("submitted", "unanswered")]
+
+    def stats(self):
+        with self._lock:
+            counts = {}
+            for (op, _), stages in self._stages.items():
+                done = self.DONE_STAGES.get(op)
+                if done and done in stages:
+                    counts[done] = counts.get(done, 0) + 1
+            counts["resolved_groups"] = len(self._groups)
+            counts["skipped"] = self.skipped
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+# Creates an earlier run sent but never got an answer for may or may not have
+# made the target. They are looked up once in a live listing: the ones that
+# exist are journaled as created (with their UUID) so they aren't sent again,
+# and only the rest are re-sent. Returns the number found.
+def recover_in_doubt_creates(api_url, token, journal, params={"target_type": "Oracle"}, page_size=PAGE_SIZE):
+    in_doubt = journal.in_doubt()
+    if not in_doubt:
+        return 0
+    logger.info("Looking up %s creates that were sent but never answered in the last run...", len(in_doubt))
+    inventory = fetch_inventory(api_url, token, params=params, page_size=page_size)
+    found = 0
+    for target_id in in_doubt:
+        target = inventory.find(target_id)
+        if target is not None:
+            journal.record("create", target_id, "created", uuid=target.uuid, recovered=True)
+            found += 1
+    logger.info("%s of them exist already; %s will be sent again.", found, len(in_doubt) - found)
+    return found
+
+# Example function to test all request types.
+# With sync=True the CSV is treated as the desired state instead: only missing
+# targets are created, only changed ones updated, and (with delete_extra)
+# Oracle targets not in the CSV deleted. dry_run only logs the plan.
+# With journal_path, progress is recorded in a JobJournal; running again with
+# the same journal picks up where an interrupted run stopped. With validate,
+# the run waits (up to validation_timeout) for the new targets to validate.
+def run_targets_script(api_url, username, password, filepath, max_workers=MAX_WORKERS, prefetch=False,
+                       sync=False, dry_run=False, delete_extra=False, metrics_json=None, metrics_prometheus=None,
+                       journal_path=None, validate=False, validation_timeout=VALIDATION_TIMEOUT):
+    journal = JobJournal(journal_path, api_url) if journal_path and not dry_run else None
+    if journal and journal.resumed:
+        logger.info("Resuming from journal %s: %s", journal_path, journal.stats())
+    try:
+        return _run_targets_script(api_url, username, password, filepath, max_workers, prefetch, sync, dry_run, delete_extra,
+                                   journal, validate, validation_timeout)
+    finally:
+        if journal:
+            logger.info("Journal %s: %s", journal_path, journal.stats())
+            journal.close()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Request metrics:\n%s", metrics.summary())
+        if metrics_json:
+            metrics.dump_json(metrics_json)
+        if metrics_prometheus:
+            metrics.dump_prometheus(metrics_prometheus)
+
+def _run_targets_script(api_url, username, password, filepath, max_workers, prefetch, sync, dry_run, delete_extra,
+                        journal, validate, validation_timeout):
     # Login
-    token = login(api_url, username, password)
+    with metrics.phase("login"):
+        token = login(api_url, username, password)
     if not token:
         logger.error("Failed to log in. Exiting the script.")
         return
+
+    if sync:
+        with metrics.phase("plan"):
+            plan = plan_reconcile(api_url, token, iter_csv_rows(filepath, header=True), delete_extra=delete_extra)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Reconcile plan:\n%s", format_reconcile_plan(plan))
+        if dry_run:
+            return plan
+        if prefetch and plan["create"]:
+            with metrics.phase("prefetch"):
+                prefetch_resolution_index(api_url, token)
+        with metrics.phase("execute"):
+            report = execute_reconcile(api_url, token, plan, max_workers=max_workers, journal=journal)
+        logger.info("Reconcile finished: %s", reconcile_summary(report))
+        if validate:
+            with metrics.phase("validate"):
+                report["validation"] = track_validation(api_url, token, created_keys(report["created"]), timeout=validation_timeout)
+        logger.info("Connection stats: %s", get_client(api_url).connection_stats())
+        return report
     
     # Get the current configured Oracle targets
     logger.info("Fetching existing Oracle targets...")
-    targets = get_targets(api_url, token, params={"target_type": "Oracle"})
+    with metrics.phase("fetch"):
+        targets = get_targets(api_url, token, params={"target_type": "Oracle"})
     if targets:
-        logger.info(f"Found {len(targets)} Oracle targets.")
+        logger.info("Found %s Oracle targets.", len(targets))
     else:
         logger.info("No Oracle targets found.")
     
     # Delete the old oracle targets
     logger.info("Deleting old Oracle targets... (This functionality needs to be implemented)")
 
-    # Parse the CSV to get JSON payload
-    payload = oracle_csv_to_json(api_url, token, filepath, header=True) 
-    logger.info(f"Parsed CSV and created payload: {len(payload)} entries.")
+    # Optionally load every VM and Oracle group up front so rows resolve locally
+    if prefetch:
+        with metrics.phase("prefetch"):
+            prefetch_resolution_index(api_url, token)
 
-    # Create the new oracle targets
-    if payload:
-        logger.info(f"Creating {len(payload)} new Oracle targets...")
-        create_oracle_targets(api_url, token, params=payload)
+    # Stream the CSV through resolve -> create; creates start while later rows are still being resolved
+    logger.info("Creating Oracle targets from %s...", filepath)
+    created = failed = 0
+    new_targets = []
+    with metrics.phase("create"):
+        for result in stream_oracle_targets(api_url, token, iter_csv_rows(filepath, header=True), max_workers=max_workers, journal=journal):
+            if result["status"] == "created":
+                created += 1
+                new_targets.append(result)
+            else:
+                failed += 1
+                logger.error("Target %s was not created (status code: %s).", result['targetId'], result['status_code'])
+    logger.info("Finished creating Oracle targets: %s created, %s failed.", created, failed)
+    if validate and new_targets:
+        with metrics.phase("validate"):
+            validation = track_validation(api_url, token, created_keys(new_targets), timeout=validation_timeout)
+        logger.info("Validation: %s", validation_summary(validation))
+    logger.info("Resolution cache stats: %s", resolution_cache_stats())
+    if api_url in _indexes:
+        logger.info("Prefetch index stats: %s", _indexes[api_url].stats())
 
-def oracle_csv_to_json(api_url, token, csv_file, header=True):
-    payload = []
+    logger.info("Connection stats: %s", get_client(api_url).connection_stats())
 
-    # Read the CSV file
-    logger.info(f"Reading CSV file: {csv_file}")
+# Yield the rows of a target CSV one at a time
+def iter_csv_rows(csv_file, header=True):
+    logger.info("Reading CSV file: %s", csv_file)
     with open(csv_file, mode='r', encoding='utf-8-sig') as file:
-        csv_reader = csv.reader(file) 
-        skipped_header = False 
+        csv_reader = csv.reader(file)
+        if header:
+            next(csv_reader, None)  # Skip the header row
         for row in csv_reader:
-            if (header and not skipped_header):
-                skipped_header = True
-                continue  # Skip the header row
-            
-            scope_uuid = create_group(api_url, token, row[0]) 
-            if not scope_uuid:
-                logger.warning(f"Couldn't create group for: {row[0]}. Check VMname matches an actual VM. Skipping this row.")
-                continue
-            # Construct the data for creating the target
-            logger.info(scope_uuid["uuid"]) 
+            if row:
+                yield row
 
-            # Group:  On-Prem - Oracle – ServerName
-            # Target:  On-Prem - Oracle - ServerName-InstanceName
-            
-            data = {
-                "category": "Applications and Databases",
-                "type": "Oracle",  
-                "inputFields": [
-                    {"name": "targetId", "value": f"On-Prem - Oracle - {row[0]}-{row[1]}"},
-                    {"name": "username", "value": row[3]},
-                    {"name": "password", "value": row[4]},
-                    {"name": "targetEntities", "value": scope_uuid["uuid"]},  
-                    {"name": "port", "value": row[2]},
-                    {"name": "databaseID", "value": row[1]},
-                    {"name": "fullValidation", "value": row[5].strip().lower()} 
-                ]
+# Group:  On-Prem - Oracle – ServerName
+# Target:  On-Prem - Oracle - ServerName-InstanceName
+def oracle_group_name(server_name):
+    return f"On-Prem - Oracle - {server_name}"
+
+def oracle_target_id(server_name, instance_name):
+    return f"{oracle_group_name(server_name)}-{instance_name}"
+
+# Resolve the group for one CSV row and build its create payload.
+# Returns None when the row can't be turned into a target.
+# With a journal, a group resolved by an earlier run is reused and a newly
+# resolved one is recorded.
+def build_oracle_target(api_url, token, row, journal=None):
+    if len(row) < 6:
+        logger.warning("Row has %s columns, expected 6: %s. Skipping this row.", len(row), row[:2])
+        return None
+
+    scope_uuid = journal.group(row[0]) if journal else None
+    if scope_uuid is None:
+        scope_uuid = create_group(api_url, token, row[0])
+        if scope_uuid and journal:
+            journal.record("resolve", row[0], "resolved", group_uuid=scope_uuid["uuid"], vm_uuid=_vm_cache.peek((api_url, row[0])))
+    if not scope_uuid:
+        logger.warning("Couldn't create group for: %s. Check VMname matches an actual VM. Skipping this row.", row[0])
+        return None
+    # Construct the data for creating the target
+    logger.info("%s", scope_uuid["uuid"])
+
+    return {
+        "category": "Applications and Databases",
+        "type": "Oracle",  
+        "inputFields": [
+            {"name": "targetId", "value": oracle_target_id(row[0], row[1])},
+            {"name": "username", "value": row[3]},
+            {"name": "password", "value": row[4]},
+            {"name": "targetEntities", "value": scope_uuid["uuid"]},  
+            {"name": "port", "value": row[2]},
+            {"name": "databaseID", "value": row[1]},
+            {"name": "fullValidation", "value": row[5].strip().lower()} 
+        ]
+    }
+
+# Yield (row, payload) pairs; payload is None for rows that could not be resolved
+def iter_oracle_payloads(api_url, token, rows):
+    for row in rows:
+        yield row, build_oracle_target(api_url, token, row)
+
+def oracle_csv_to_json(api_url, token, csv_file, header=True):
+    rows = iter_csv_rows(csv_file, header=header)
+    return [payload for _, payload in iter_oracle_payloads(api_url, token, rows) if payload]
+
+# Streaming create pipeline: rows are parsed and resolved (VM, group) one at a
+# time on the calling thread while up to max_workers creates run on the worker
+# pool, so only the rows in flight are ever held in memory. Yields one result
+# dict per row (see create_oracle_targets) as soon as its create finishes.
+# With a journal (see JobJournal), rows it shows as created are not sent
+# again; their result is marked "resumed". Creates it shows as sent but never
+# answered are first looked up (see recover_in_doubt_creates).
+def stream_oracle_targets(api_url, token, rows, max_workers=MAX_WORKERS, timeout=CREATE_TIMEOUT, journal=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for creating Oracle targets.")
+        return
+    if journal:
+        recover_in_doubt_creates(api_url, token, journal)
+
+    def resolve(rows):
+        for row in rows:
+            target_id = oracle_target_id(row[0], row[1]) if len(row) > 1 else None
+            done = journal.completed("create", target_id) if journal and target_id else None
+            yield row, None if done else build_oracle_target(api_url, token, row, journal), done
+
+    def create(item):
+        row, payload, done = item
+        if done:
+            journal.skip()
+            return {
+                "targetId": done["key"],
+                "status": "created",
+                "status_code": done.get("status_code"),
+                "uuid": done.get("uuid"),
+                "latency": None,
+                "error": None,
+                "resumed": True,
+            }
+        if payload is None:
+            return {
+                "targetId": oracle_target_id(row[0], row[1]) if len(row) > 1 else None,
+                "status": "failed",
+                "status_code": None,
+                "uuid": None,
+                "latency": None,
+                "error": "Could not resolve the VM or group for this row.",
             }
+        return _create_oracle_target(client, api_url, payload, timeout=timeout, journal=journal)
+
+    yield from _bounded_imap(create, resolve(rows), max_workers=max_workers)
+
+# Outcome of a target status: validated, failed or pending (still settling)
+def validation_state(status):
+    status = (status or "").strip().lower()
+    if status in VALIDATED_STATUSES:
+        return "validated"
+    if not status or any(marker in status for marker in VALIDATION_PENDING_MARKERS):
+        return "pending"
+    return "failed"
 
-            payload.append(data)
-    return payload
+# Follow newly created targets until each one validates, fails or time runs
+# out. targets are UUIDs or targetIds (e.g. from create results). Instead of
+# one GET per target, every poll pages through the /targets listing once and
+# checks all still-pending targets against it, stopping as soon as it has seen
+# them all; polls back off from poll_interval to poll_max. Returns {key:
+# {status validated/failed/timed_out/cancelled, target_status, uuid, seconds}}.
+# on_result(key, result) is called as soon as each target settles.
+def track_validation(api_url, token, targets, timeout=VALIDATION_TIMEOUT, poll_interval=VALIDATION_POLL_INTERVAL,
+                     poll_max=VALIDATION_POLL_MAX, params={"target_type": "Oracle"}, page_size=PAGE_SIZE,
+                     on_result=None, cancel_event=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for tracking target validation.")
+        return None
+
+    start = time.monotonic()
+    pending = {key: {"status": "timed_out", "target_status": None, "uuid": None, "seconds": None}
+               for key in dict.fromkeys(key for key in targets if key)}
+    report = dict(pending)
+    delay = poll_interval
+    polls = 0
+    logger.info("Waiting for %s targets to validate (up to %ss)...", len(pending), timeout)
+    while pending and not (cancel_event and cancel_event.is_set()):
+        polls += 1
+        unseen = set(pending)
+        try:
+            for page in iter_target_pages(api_url, token, params=params, page_size=page_size, fields=TARGET_JSON_FIELDS):
+                for target in map(Target.from_json, page):
+                    key = target.uuid if target.uuid in pending else target.key
+                    if key not in pending:
+                        continue
+                    unseen.discard(key)
+                    result = pending[key]
+                    result["uuid"] = target.uuid
+                    result["target_status"] = target.status
+                    state = validation_state(target.status)
+                    if state == "pending":
+                        continue
+                    result["status"] = state
+                    result["seconds"] = round(time.monotonic() - start, 1)
+                    del pending[key]
+                    if state == "failed":
+                        logger.error("Target %s failed validation: %s", key, target.status)
+                    if on_result:
+                        on_result(key, result)
+                if not unseen:
+                    break  # every pending target has been seen on this pass
+        except (RequestException, ValueError) as e:
+            logger.error("Polling target status failed, will try again: %s", e)
+
+        remaining = timeout - (time.monotonic() - start)
+        if not pending or remaining <= 0:
+            break
+        if cancel_event:
+            cancel_event.wait(min(delay, remaining))
+        else:
+            time.sleep(min(delay, remaining))
+        delay = min(delay * 2, poll_max)
+
+    cancelled = bool(cancel_event and cancel_event.is_set())
+    for key, result in pending.items():
+        result["status"] = "cancelled" if cancelled else "timed_out"
+        result["seconds"] = round(time.monotonic() - start, 1)
+        if not cancelled:
+            logger.error("Target %s had not validated after %ss (status: %s).", key, timeout, result['target_status'])
+        if on_result:
+            on_result(key, result)
+    counts = {}
+    for result in report.values():
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    logger.info("Validation tracking finished after %s polls: %s", polls, counts)
+    return report
+
+# Keys to track for the created targets in create results: the UUID, or the
+# targetId when the create response didn't include one
+def created_keys(results):
+    return [result["uuid"] or result["targetId"] for result in results if result["status"] == "created"]
+
+def validation_summary(report):
+    return {status: sum(1 for result in (report or {}).values() if result["status"] == status)
+            for status in ("validated", "failed", "timed_out", "cancelled")}
 
 def create_group(api_url, token, server_name):
     # Check inputs
-    if not token:
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for creating group.")
         return None
     if not server_name:
         logger.error("Group_name and VM_name should be supplied in the CSV file.")
         return None
 
-    # TO-DO: search if a group with this name exists
-    logger.info(f"Attempting to find an existing group")
-    response = request_with_retries(method="GET", url=f"{api_url}{SEARCH_ENDPOINT}", params={"q": f"On-Prem - Oracle - {server_name}", "types": ["Group"]}, headers={"cookie": token})
-    existing_groups = response.json()
-    if len(existing_groups) > 0:
-        return existing_groups[0]
+    return _group_cache.get_or_compute((api_url, server_name), lambda: _find_or_create_group(client, api_url, server_name))
+
+def _find_or_create_group(client, api_url, server_name):
+    index = _indexes.get(api_url)
+    if index is not None:
+        group = index.group(server_name)
+        if group:
+            return group
+
+    logger.info("Attempting to find an existing group")
+    response = request_with_retries(method="GET", url=f"{api_url}{SEARCH_ENDPOINT}", params={"q": oracle_group_name(server_name), "types": ["Group"]}, client=client, stream=True)
+    # Only the first match is used; stop reading there
+    existing_groups = iter_json_array(response, fields=SEARCH_FIELDS)
+    existing_group = next(existing_groups, None)
+    existing_groups.close()
+    if existing_group:
+        return existing_group
 
     try:
-        logger.info(f"Attempting to create group with for and VM: {server_name}...")
+        logger.info("Attempting to create group with for and VM: %s...", server_name)
         url = f"{api_url}{GROUPS_ENDPOINT}"
 
         # Get the UUID for the VM specified in the row of the CSV
-        vm_uuid = get_vm_uuid(api_url, token, server_name)
+        vm_uuid = get_vm_uuid(api_url, client.token, server_name)
         if not vm_uuid:
-            logger.error(f"Could not create group because couldn't fetch VM uuid.")
+            logger.error("Could not create group because couldn't fetch VM uuid.")
             return None
 
         # Create the payload to send to the Turbo backend to create the group
         data = {"criteriaList":[],
-                "displayName": f"On-Prem - Oracle - {server_name}",
+                "displayName": oracle_group_name(server_name),
                 "groupType":"VirtualMachine",
                 "isStatic":True,
                 "memberUuidList":[vm_uuid]
                 }
 
         # POST to create the group
-        create = request_with_retries("POST", url, data=data, headers={"cookie": token})
+        create = request_with_retries("POST", url, data=data, client=client)
         # Check if the response was successful
         if create.status_code == 200:
-            logger.info(f"Group successfully created")
+            logger.info("Group successfully created")
             return create.json()
         else:
-            logger.error(f"Failed to create group in API req. {server_name}. Status code: {create.status_code}.")
+            logger.error("Failed to create group in API req. %s. Status code: %s.", server_name, create.status_code)
             return None
     except Exception as e:
-        logger.error(f"Error occurred while updating target {server_name}: {e}")
+        logger.error("Error occurred while updating target %s: %s", server_name, e)
         return None
 
 def get_vm_uuid(api_url, token, vm_name):
+    client = _resolve_client(api_url, token)
+    return _vm_cache.get_or_compute((api_url, vm_name), lambda: _lookup_vm_uuid(client, api_url, vm_name))
+
+def _lookup_vm_uuid(client, api_url, vm_name):
+    index = _indexes.get(api_url)
+    if index is not None:
+        vm_uuid = index.vm_uuid(vm_name)
+        if vm_uuid:
+            return vm_uuid
+
     try:
-        logger.info(f"Looking up UUID for VM: {vm_name}")
-        response = request_with_retries(method="GET", url=f"{api_url}{SEARCH_ENDPOINT}", params={"q": vm_name, "types": ["VirtualMachine"]}, headers={"cookie": token})
-        res_data = response.json()
-        
+        logger.info("Looking up UUID for VM: %s", vm_name)
+        response = request_with_retries(method="GET", url=f"{api_url}{SEARCH_ENDPOINT}", params={"q": vm_name, "types": ["VirtualMachine"]}, client=client, stream=True)
+        # Two matches are enough to know the name is ambiguous; stop reading there
+        matches = iter_json_array(response, fields=("uuid",))
+        res_data = [match for _, match in zip(range(2), matches)]
+        matches.close()
+
         if len(res_data) != 1:
-            logger.warning(f"Expected 1 result for VM {vm_name}, found {len(res_data)}. Skipping.")
+            logger.warning("Expected 1 result for VM %s, found %s. Skipping.", vm_name, ('more than one' if res_data else 'none'))
             return None
         return res_data[0]['uuid']
     except Exception as e:
-        logger.error(f"Failed to retrieve scope UUID for {vm_name}: {e}")
+        logger.error("Failed to retrieve scope UUID for %s: %s", vm_name, e)
         return None
 
 # Function to perform PUT request on /targets/{target_UUID}
-def update_target(api_url, token, target_uuid, data=None):
-    if not token:
+def update_target(api_url, token, target_uuid, data=None, rediscover=True):
+    client = _resolve_client(api_url, token)
+    if not client.token:
         logger.error("Token is required for updating targets.")
         return None
     if not target_uuid:
@@ -327,30 +1978,255 @@ def update_target(api_url, token, target_uuid, data=None):
         data = {}
 
     try:
-        logger.info(f"Attempting to update target with UUID: {target_uuid}...")
+        logger.info("Attempting to update target with UUID: %s...", target_uuid)
         url = f"{api_url}{TARGETS_ENDPOINT}/{target_uuid}"
         
         # Sending the PUT request to update the target
-        response = request_with_retries("PUT", url, data=data, headers={"cookie": token})
+        response = request_with_retries("PUT", url, data=data, client=client)
         # Rediscover the target after editing it
-        rediscover = request_with_retries("POST", url + "?rediscover=true", headers={"cookie": token})
+        rediscovered = True
+        if rediscover:
+            rediscovered = request_with_retries("POST", url + "?rediscover=true", client=client).status_code == 200
 
         # Check if the response was successful
-        if response.status_code == 200 and rediscover.status_code == 200:
-            logger.info(f"Target {target_uuid} successfully updated.")
+        if response.status_code == 200 and rediscovered:
+            logger.info("Target %s successfully updated.", target_uuid)
             return response.json()
         else:
-            logger.error(f"Failed to update target {target_uuid}. Status code: {response.status_code}.")
+            logger.error("Failed to update target %s. Status code: %s.", target_uuid, response.status_code)
             return None
     except Exception as e:
-        logger.error(f"Error occurred while updating target {target_uuid}: {e}")
+        logger.error("Error occurred while updating target %s: %s", target_uuid, e)
+        return None
+
+# Send one request for a bulk update phase and time it
+def _timed_request(client, method, url, data=None, limiter=None, cancel_event=None):
+    outcome = {"ok": False, "status_code": None, "latency": None, "error": None, "cancelled": False}
+    if cancel_event and cancel_event.is_set():
+        outcome["cancelled"] = True
+        return outcome
+    if limiter:
+        limiter.acquire()
+    start = time.perf_counter()
+    try:
+        response = request_with_retries(method, url, data=data, client=client)
+        outcome["status_code"] = response.status_code
+        outcome["ok"] = response.ok
+    except Exception as e:
+        response = getattr(e, "response", None)
+        if response is not None:
+            outcome["status_code"] = response.status_code
+        outcome["error"] = str(e)
+    outcome["latency"] = round(time.perf_counter() - start, 3)
+    return outcome
+
+# Update many targets at once. updates maps target UUID -> PUT body.
+# Phase 1 sends all PUTs with up to max_workers in flight. Phase 2 (skipped when
+# rediscover is False) asks for one rediscovery per successfully updated target,
+# with its own, smaller concurrency and a requests-per-second ceiling so the
+# server isn't hit with a burst of discoveries. Returns {uuid: {status
+# updated/failed/cancelled, status_code, put_latency, rediscover
+# ok/failed/skipped/cancelled, rediscover_latency, error}}.
+# on_result(phase, uuid, result) is called as each request finishes. With a
+# journal, targets it shows as updated are not sent again (only their
+# rediscovery, if that didn't finish).
+def bulk_update_targets(api_url, token, updates, max_workers=MAX_WORKERS, rediscover=True,
+                        rediscover_workers=REDISCOVER_WORKERS, rediscover_rate=REDISCOVER_RATE,
+                        on_result=None, cancel_event=None, journal=None):
+    client = _resolve_client(api_url, token)
+    if not client.token:
+        logger.error("Token is required for updating targets.")
         return None
 
+    updates = {uuid: data for uuid, data in updates.items() if uuid}
+    report = {uuid: {"status": "failed", "status_code": None, "put_latency": None,
+                     "rediscover": "skipped", "rediscover_latency": None, "error": None} for uuid in updates}
+
+    pending = list(updates)
+    if journal:
+        pending = []
+        for uuid in updates:
+            if journal.completed("update", uuid):
+                journal.skip()
+                report[uuid].update(status="updated", resumed=True)
+                if on_result:
+                    on_result("update", uuid, report[uuid])
+            else:
+                pending.append(uuid)
+
+    def put(uuid):
+        return uuid, _timed_request(client, "PUT", f"{api_url}{TARGETS_ENDPOINT}/{uuid}", data=updates[uuid] or {}, cancel_event=cancel_event)
+
+    logger.info("Updating %s targets with up to %s requests in flight...", len(pending), max_workers)
+    for uuid, outcome in _bounded_imap(put, pending, max_workers=max_workers):
+        result = report[uuid]
+        result["status"] = "cancelled" if outcome["cancelled"] else ("updated" if outcome["ok"] else "failed")
+        result["status_code"] = outcome["status_code"]
+        result["put_latency"] = outcome["latency"]
+        result["error"] = outcome["error"]
+        if result["status"] == "failed":
+            logger.error("Failed to update target %s. Status code: %s. %s", uuid, outcome['status_code'], outcome['error'] or '')
+        if journal and result["status"] != "cancelled":
+            journal.record("update", uuid, result["status"], status_code=result["status_code"], error=result["error"])
+        if on_result:
+            on_result("update", uuid, result)
+
+    updated = [uuid for uuid in updates if report[uuid]["status"] == "updated"]
+    to_rediscover = updated
+    if journal:
+        for uuid in updated:
+            if journal.stage("update", uuid, "rediscovered"):
+                report[uuid]["rediscover"] = "ok"
+        to_rediscover = [uuid for uuid in updated if report[uuid]["rediscover"] != "ok"]
+    if rediscover and to_rediscover:
+        limiter = RateLimiter(rediscover_rate)
+
+        def rediscover_one(uuid):
+            return uuid, _timed_request(client, "POST", f"{api_url}{TARGETS_ENDPOINT}/{uuid}?rediscover=true", limiter=limiter, cancel_event=cancel_event)
+
+        logger.info("Rediscovering %s updated targets at up to %s per second...", len(to_rediscover), rediscover_rate or 'unlimited')
+        for uuid, outcome in _bounded_imap(rediscover_one, to_rediscover, max_workers=rediscover_workers):
+            result = report[uuid]
+            result["rediscover"] = "cancelled" if outcome["cancelled"] else ("ok" if outcome["ok"] else "failed")
+            result["rediscover_latency"] = outcome["latency"]
+            if result["rediscover"] == "failed":
+                result["error"] = outcome["error"] or f"Rediscovery returned status code {outcome['status_code']}."
+                logger.error("Failed to rediscover target %s. %s", uuid, result['error'])
+            if journal and result["rediscover"] != "cancelled":
+                journal.record("update", uuid, "rediscovered" if result["rediscover"] == "ok" else "rediscover_failed",
+                               status_code=outcome["status_code"])
+            if on_result:
+                on_result("rediscover", uuid, result)
+
+    logger.info("Bulk update finished: %s of %s targets updated.", len(updated), len(updates))
+    return report
+
+# Input fields compared between a CSV row and an existing target
+RECONCILE_FIELDS = ("username", "password", "port", "databaseID", "fullValidation")
+
+# The input fields a CSV row asks for
+def _row_fields(row):
+    return {
+        "username": row[3],
+        "password": row[4],
+        "port": row[2],
+        "databaseID": row[1],
+        "fullValidation": row[5].strip().lower(),
+    }
+
+def _same_value(current, desired):
+    return str(current).strip().lower() == str(desired).strip().lower()
+
+# Compare the CSV (desired state) with the live Oracle targets, matched on the
+# "On-Prem - Oracle - {server}-{instance}" targetId. Returns a plan dict:
+#   create    - CSV rows with no target yet
+#   update    - {uuid, targetId, changed, data} for targets whose fields differ
+#   delete    - {uuid, targetId} for Oracle targets not in the CSV (only with delete_extra)
+#   unchanged - targetIds that already match
+# Secret fields such as the password are usually not returned by the API;
+# when the current value is missing or masked it can't be compared and is not
+# counted as a difference, but it is still sent with any update of that target.
+def plan_reconcile(api_url, token, rows, delete_extra=False, params={"target_type": "Oracle"}, inventory=None):
+    # An inventory the caller already holds (e.g. the GUI's) saves fetching every target again
+    if inventory is None:
+        inventory = fetch_inventory(api_url, token, params=params)
+
+    plan = {"create": [], "update": [], "delete": [], "unchanged": []}
+    wanted = set()
+    for row in rows:
+        if len(row) < 6:
+            logger.warning("Row has %s columns, expected 6: %s. Skipping this row.", len(row), row[:2])
+            continue
+        target_id = oracle_target_id(row[0], row[1])
+        if target_id in wanted:
+            logger.warning("%s is listed more than once in the CSV. Using the first row.", target_id)
+            continue
+        wanted.add(target_id)
+
+        current = inventory.find(target_id)
+        if current is None:
+            plan["create"].append(row)
+            continue
+
+        uuid = current.uuid
+        desired = _row_fields(row)
+        changed = []
+        for name in RECONCILE_FIELDS:
+            value = current.field(name)
+            if name == "password" and (value is None or set(str(value)) <= {"*"}):
+                continue
+            if not _same_value(value, desired[name]):
+                changed.append(name)
+        if not changed:
+            plan["unchanged"].append(target_id)
+            continue
+        plan["update"].append({
+            "uuid": uuid,
+            "targetId": target_id,
+            "changed": changed,
+            "data": {
+                "category": "Applications and Databases",
+                "type": "Oracle",
+                "uuid": uuid,
+                "inputFields": [{"name": name, "value": desired[name]} for name in RECONCILE_FIELDS],
+            },
+        })
+
+    if delete_extra:
+        for target in inventory:
+            if target.key not in wanted and str(target.key).startswith(oracle_group_name("")):
+                plan["delete"].append({"uuid": target.uuid, "targetId": target.key})
+    return plan
+
+# Human readable plan for dry runs
+def format_reconcile_plan(plan):
+    lines = [f"{len(plan['create'])} to create, {len(plan['update'])} to update, "
+             f"{len(plan['delete'])} to delete, {len(plan['unchanged'])} unchanged."]
+    for row in plan["create"]:
+        lines.append(f"  + create {oracle_target_id(row[0], row[1])}")
+    for update in plan["update"]:
+        lines.append(f"  ~ update {update['targetId']} ({', '.join(update['changed'])})")
+    for delete in plan["delete"]:
+        lines.append(f"  - delete {delete['targetId']}")
+    return "\n".join(lines)
+
+# Apply a plan from plan_reconcile, issuing only the calls it lists.
+# on_result(action, key, result) is called as each call finishes, with action
+# create (key is the targetId), update, rediscover or delete (key is the UUID).
+def execute_reconcile(api_url, token, plan, max_workers=MAX_WORKERS, rediscover=True, rate=None, on_result=None, journal=None):
+    report = {"created": [], "updated": {}, "deleted": {}, "unchanged": len(plan["unchanged"])}
+    if plan["create"]:
+        for result in stream_oracle_targets(api_url, token, plan["create"], max_workers=max_workers, journal=journal):
+            report["created"].append(result)
+            if on_result:
+                on_result("create", result["targetId"], result)
+    if plan["update"]:
+        updates = {update["uuid"]: update["data"] for update in plan["update"]}
+        report["updated"] = bulk_update_targets(api_url, token, updates, max_workers=max_workers, rediscover=rediscover,
+                                                rediscover_rate=rate or REDISCOVER_RATE, on_result=on_result, journal=journal) or {}
+    if plan["delete"]:
+        on_delete = (lambda uuid, result: on_result("delete", uuid, result)) if on_result else None
+        report["deleted"] = bulk_delete_targets(api_url, token, [delete["uuid"] for delete in plan["delete"]],
+                                                max_workers=max_workers, rate=rate, on_result=on_delete, journal=journal) or {}
+    return report
+
+def reconcile_summary(report):
+    return {
+        "created": sum(1 for result in report["created"] if result["status"] == "created"),
+        "create_failed": sum(1 for result in report["created"] if result["status"] != "created"),
+        "updated": sum(1 for result in report["updated"].values() if result["status"] == "updated"),
+        "update_failed": sum(1 for result in report["updated"].values() if result["status"] != "updated"),
+        "deleted": sum(1 for result in report["deleted"].values() if result["status"] == "deleted"),
+        "delete_failed": sum(1 for result in report["deleted"].values() if result["status"] != "deleted"),
+        "unchanged": report["unchanged"],
+    }
+
 if __name__ == "__main__":
     # Information to be passed from command line or configuration
     API_URL = "https://url"
     username = "administrator"
     password = "administrator"
     filepath =  "filepath here"
+    setup_logging(logging.INFO)
     # Run the script
     run_targets_script(api_url=API_URL, username=username, password=password, filepath=filepath)
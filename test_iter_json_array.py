@@ -0,0 +1,100 @@
+import json
+import random
+import unittest
+from oracle_script import iter_json_array
+
+# Unit tests for the streaming JSON array decoder in oracle_script.py. Bodies
+# are fed through in small chunks so elements, numbers and multi-byte
+# characters get split at every possible boundary.
+#
+#   python -m unittest test_iter_json_array
+
+class FakeResponse:
+    def __init__(self, body, encoding="utf-8", headers=None):
+        self.body = body.encode(encoding) if isinstance(body, str) else body
+        self.encoding = encoding
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+def decode(body, chunk_size=1, fields=None):
+    return list(iter_json_array(FakeResponse(body), fields=fields, chunk_size=chunk_size))
+
+def random_value(rng, depth=0):
+    kind = rng.choice(("int", "float", "exp", "str", "bool", "null", "list", "dict") if depth < 2 else ("int", "float", "str", "null"))
+    if kind == "int":
+        return rng.randint(-10 ** 6, 10 ** 6)
+    if kind == "float":
+        return round(rng.uniform(-1000, 1000), rng.randint(1, 6))
+    if kind == "exp":
+        return float(f"{rng.randint(1, 9)}e{rng.randint(-20, 20)}")
+    if kind == "str":
+        return "".join(rng.choice("ab\"\\,]} é€\n") for _ in range(rng.randint(0, 8)))
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    if kind == "list":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randint(0, 3))}
+
+class IterJsonArrayTest(unittest.TestCase):
+    def test_random_arrays_in_small_chunks(self):
+        rng = random.Random(20)
+        for _ in range(300):
+            items = [random_value(rng) for _ in range(rng.randint(0, 8))]
+            body = json.dumps(items, ensure_ascii=rng.random() < 0.5, indent=rng.choice((None, 1)))
+            for chunk_size in (1, 2, 3, 4, 7):
+                self.assertEqual(decode(body, chunk_size), items, (body, chunk_size))
+
+    def test_numbers_split_inside_fraction_or_exponent(self):
+        self.assertEqual(decode("[12.5, 3]", 4), [12.5, 3])
+        self.assertEqual(decode("[1e5]", 1), [1e5])
+        self.assertEqual(decode("[-0.25E-3,true,null,false]", 1), [-0.25e-3, True, None, False])
+        self.assertEqual(decode("[1, 2]", 64), [1, 2])
+
+    def test_whitespace_bom_and_empty(self):
+        self.assertEqual(decode("\ufeff [ 1 , 2 ] \n", 1), [1, 2])
+        self.assertEqual(decode("[]", 1), [])
+        self.assertEqual(decode(" [ ] ", 1), [])
+        self.assertEqual(decode("", 1), [])
+
+    def test_body_that_is_not_an_array(self):
+        self.assertEqual(decode('{"uuid": "a"}', 2), [{"uuid": "a"}])
+        self.assertEqual(decode("5", 1), [5])
+
+    def test_fields_are_projected(self):
+        self.assertEqual(decode('[{"uuid": "a", "x": 1}, 2]', 3, fields=("uuid",)), [{"uuid": "a"}, 2])
+
+    def test_malformed_arrays_are_rejected(self):
+        for body in ("[1 2]", "[,1]", "[1,]", "[1,,2]", "[1]x", "[1] [2]", '["a" "b"]', "[{} {}]", "[tru]", "[1e]"):
+            for chunk_size in (1, 3, 64):
+                with self.assertRaises(ValueError, msg=(body, chunk_size)):
+                    decode(body, chunk_size)
+
+    def test_truncated_arrays_are_rejected(self):
+        for body in ("[1, 2", "[1,", '[{"a": 1}', "[12.", "["):
+            for chunk_size in (1, 64):
+                with self.assertRaises(ValueError, msg=(body, chunk_size)):
+                    decode(body, chunk_size)
+
+    def test_response_is_closed(self):
+        response = FakeResponse("[1, 2, 3]")
+        items = iter_json_array(response, chunk_size=1)
+        self.assertEqual(next(items), 1)
+        items.close()
+        self.assertTrue(response.closed)
+
+        response = FakeResponse("[1, ")
+        with self.assertRaises(ValueError):
+            list(iter_json_array(response))
+        self.assertTrue(response.closed)
+
+if __name__ == "__main__":
+    unittest.main()
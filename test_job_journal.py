@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+import unittest
+import oracle_script
+from mock_turbo_server import MockTurbonomic, start_mock_server, mock_vm_name
+
+# Tests for resuming a journaled create run (JobJournal) against the local
+# mock Turbonomic server.
+#
+#   python -m unittest test_job_journal
+
+class JobJournalResumeTest(unittest.TestCase):
+    def setUp(self):
+        oracle_script.close_clients()
+        oracle_script.clear_resolution_caches()
+        self.api = MockTurbonomic(vms=4, latency=1.0, seed=1)
+        self.server, self.url = start_mock_server(self.api)
+        self.workdir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.workdir.name, "create.jsonl")
+
+    def tearDown(self):
+        oracle_script.close_clients()
+        self.server.shutdown()
+        self.server.server_close()
+        self.workdir.cleanup()
+
+    def create(self, rows, timeout):
+        journal = oracle_script.JobJournal(self.journal_path, self.url)
+        try:
+            return list(oracle_script.stream_oracle_targets(self.url, "", rows, timeout=timeout, journal=journal))
+        finally:
+            journal.close()
+
+    # A create that timed out may still have gone through on the server, so
+    # resuming must look it up rather than send it again
+    def test_timed_out_creates_are_not_sent_twice(self):
+        self.assertTrue(oracle_script.login(self.url, "administrator", "administrator"))
+        rows = [[mock_vm_name(i), f"db{i}", "1521", "oracle", "secret", "False"] for i in range(2)]
+        # Resolve the groups first so only the target POSTs can time out
+        for row in rows:
+            oracle_script.build_oracle_target(self.url, "", row)
+
+        first = self.create(rows, timeout=0.3)
+        self.assertEqual([result["status"] for result in first], ["failed", "failed"])
+        time.sleep(1.5)  # let the server finish the creates the client gave up on
+        self.assertEqual(len(self.api.targets), 2)
+
+        resumed = self.create(rows, timeout=5)
+        self.assertEqual([result["status"] for result in resumed], ["created", "created"])
+        self.assertTrue(all(result.get("resumed") for result in resumed))
+        self.assertEqual(len(self.api.targets), 2)
+        self.assertEqual(sorted(target["displayName"] for target in self.api.targets.values()),
+                         sorted(oracle_script.oracle_target_id(row[0], row[1]) for row in rows))
+
+    # A create the server answered with an error is final; one without an
+    # answer (or with no outcome recorded before a crash) is in doubt
+    def test_only_unanswered_creates_are_in_doubt(self):
+        journal = oracle_script.JobJournal(self.journal_path, self.url)
+        journal.record("create", "a", "submitted")
+        journal.record("create", "a", "failed", status_code=400)
+        journal.record("create", "b", "submitted")
+        journal.record("create", "b", "unanswered")
+        journal.record("create", "c", "submitted")
+        journal.close()
+        journal = oracle_script.JobJournal(self.journal_path, self.url)
+        self.assertEqual(sorted(journal.in_doubt()), ["b", "c"])
+        journal.close()
+
+if __name__ == "__main__":
+    unittest.main()